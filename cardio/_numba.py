@@ -0,0 +1,27 @@
+"""
+Optional Numba support.
+
+Numba is not a hard requirement of the project. When it is not installed,
+`njit` degrades to a no-op decorator and `prange` to `range`, so the same
+kernels still run (slowly) as plain Python.
+"""
+
+from __future__ import annotations
+
+try:
+    from numba import njit, prange
+
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - depends on the environment
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Fallback for numba.njit: return the function unchanged."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+
+        return decorator
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Tuple
 
 import numpy as np
@@ -52,12 +53,15 @@ def reconstruct_parameters_from_tf_coeffs(a0: float, a1: float, b0: float, b1: f
     return C_hat, I_hat, R_hat
 
 
+@lru_cache(maxsize=1024)
 def roundtrip_identifiability(params: ParameterSet) -> IdentifiabilityRoundtrip:
     """
     Numerical 'roundtrip' identifiability verification for the arterial LTI sub-model.
 
     Uses arterial_tf_coeffs(params) to get (a0,a1,b0,b1), then reconstructs (C_hat,I_hat,R_hat),
     and compares to the original parameters (Cart, Iart, R_h=Rtot under our convention).
+
+    Results are cached per ParameterSet (the returned dataclass is immutable).
     """
     a0, a1, b0, b1 = arterial_tf_coeffs(params)
     C_hat, I_hat, R_hat = reconstruct_parameters_from_tf_coeffs(a0, a1, b0, b1)
@@ -83,6 +87,7 @@ def roundtrip_identifiability(params: ParameterSet) -> IdentifiabilityRoundtrip:
     )
 
 
+@lru_cache(maxsize=1024)
 def is_structurally_identifiable(params: ParameterSet, tol: float = 1e-12) -> bool:
     """
     Practical check: roundtrip errors should be near zero (within tol).
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Tuple
 
 import numpy as np
@@ -46,23 +47,23 @@ def _arterial_resistance(params: ParameterSet) -> float:
     """
     Return the arterial resistance used in the arterial LTI sub-model.
 
-    In our project convention we often set Rcap = Rart -> Rtot = 2*Rart.
-    Prefer params.Rtot if present; otherwise fall back to 2*params.Rart.
+    This is the total peripheral resistance Rtot = Rart + Rcap, the same
+    resistance used by the nonlinear model (Eq.57).
     """
-    rtot = getattr(params, "Rtot", None)
-    if rtot is None:
-        return 2.0 * float(params.Rart)
-    return float(rtot)
+    return float(params.Rtot)
 
 
+@lru_cache(maxsize=256)
 def arterial_lti_matrices(params: ParameterSet) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
     """
     Build (A,B,C,D) for the linearized arterial sub-model using parameters.
 
+    Results are cached per ParameterSet; the returned arrays are read-only.
+
     Uses:
         C_art = params.Cart
         I_art = params.Iart
-        R_h   = params.Rtot (preferred) or 2*params.Rart fallback
+        R_h   = params.Rtot (= Rart + Rcap)
 
     Returns:
         A (2x2), B (2x1), C (1x2), D (1x1)
@@ -84,9 +85,14 @@ def arterial_lti_matrices(params: ParameterSet) -> Tuple[np.ndarray, np.ndarray,
     B = np.array([[1.0 / C_art], [0.0]], dtype=float)
     C = np.array([[1.0, 0.0]], dtype=float)
     D = np.array([[0.0]], dtype=float)
+
+    # Shared through the cache: guard against in-place modification.
+    for M in (A, B, C, D):
+        M.flags.writeable = False
     return A, B, C, D
 
 
+@lru_cache(maxsize=256)
 def arterial_tf_coeffs(params: ParameterSet) -> Tuple[float, float, float, float]:
     """
     Return transfer-function polynomial coefficients (a0,a1,b0,b1) for:
@@ -100,6 +106,7 @@ def arterial_tf_coeffs(params: ParameterSet) -> Tuple[float, float, float, float
         a0 = 1/(C*I)
 
     where R is the arterial resistance R_h (Rtot under our convention).
+    Results are cached per ParameterSet.
     """
     C_art = float(params.Cart)
     I_art = float(params.Iart)
@@ -138,6 +145,65 @@ def arterial_expected_zero(b0: float, b1: float) -> float:
     return float(-b0 / b1)
 
 
+def evaluate_arterial_tf(
+    a0: float,
+    a1: float,
+    b0: float,
+    b1: float,
+    s: complex | np.ndarray,
+) -> complex | np.ndarray:
+    """
+    Evaluate H(s) = (b1*s + b0) / (s^2 + a1*s + a0) at s (scalar or array).
+
+    The denominator is written in Horner form, (s + a1)*s + a0, so each point
+    costs a handful of multiply/adds instead of a generic polyval.
+    For the frequency response use s = 1j*w.
+    """
+    return (b1 * s + b0) / ((s + a1) * s + a0)
+
+
+def arterial_impulse_step(
+    a0: float,
+    a1: float,
+    b0: float,
+    b1: float,
+    t: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Closed-form impulse and step responses of H(s) = (b1*s + b0) / (s^2 + a1*s + a0).
+
+    With distinct poles p_k and residues r_k = (b1*p_k + b0) / (2*p_k + a1):
+      impulse  y(t) = sum_k r_k * exp(p_k t)
+      step     y(t) = sum_k r_k * (exp(p_k t) - 1) / p_k
+    A repeated pole p gives y(t) = (b1 + (b1*p + b0)*t) * exp(p t) and its
+    integral. Poles must be nonzero (a0 != 0), as for the Windkessel model.
+    """
+    if a0 == 0.0:
+        raise ValueError("a0 must be nonzero (pole at the origin)")
+
+    t = np.asarray(t, dtype=float)
+    poles, _ = arterial_poles_zeros_from_tf(a0, a1, b0, b1)
+    p1, p2 = poles
+
+    if abs(p1 - p2) > 1e-9 * max(abs(p1), abs(p2)):
+        y_imp = np.zeros(t.shape, dtype=complex)
+        y_step = np.zeros(t.shape, dtype=complex)
+        for p in (p1, p2):
+            r = (b1 * p + b0) / (2.0 * p + a1)
+            e = np.exp(p * t)
+            y_imp += r * e
+            y_step += (r / p) * (e - 1.0)
+        return y_imp.real, y_step.real
+
+    # Repeated (real) pole: H(s) = b1/(s - p) + c/(s - p)^2 with c = b1*p + b0
+    p = float(np.real(p1))
+    c = b1 * p + b0
+    e = np.exp(p * t)
+    y_imp = (b1 + c * t) * e
+    y_step = (b1 / p) * (e - 1.0) + c * (t * e / p - (e - 1.0) / (p * p))
+    return y_imp, y_step
+
+
 def arterial_poles_zeros_from_tf(a0: float, a1: float, b0: float, b1: float) -> Tuple[np.ndarray, np.ndarray]:
     """
     Compute poles and zeros from polynomial coefficients.
@@ -145,13 +211,23 @@ def arterial_poles_zeros_from_tf(a0: float, a1: float, b0: float, b1: float) ->
     Den: s^2 + a1*s + a0  -> poles are roots
     Num: b1*s + b0        -> single zero (or none if degenerate)
     """
-    den = np.array([1.0, float(a1), float(a0)], dtype=float)
-    num = np.array([float(b1), float(b0)], dtype=float)
-
-    poles = np.roots(den)
-
-    # For first-order numerator, np.roots gives one root (zero).
-    zeros = np.roots(num) if np.any(np.abs(num) > 0) else np.array([], dtype=complex)
+    a0 = float(a0)
+    a1 = float(a1)
+    b0 = float(b0)
+    b1 = float(b1)
+
+    # Quadratic formula instead of np.roots (companion-matrix eigensolve).
+    disc = a1 * a1 - 4.0 * a0
+    if disc >= 0.0:
+        # Real poles: numerically stable form (no cancellation when a1^2 >> a0).
+        q = -0.5 * (a1 + np.copysign(np.sqrt(disc), a1))
+        poles = np.array([q, a0 / q] if q != 0.0 else [0.0, 0.0], dtype=float)
+    else:
+        sq = 0.5j * np.sqrt(-disc)
+        poles = np.array([-0.5 * a1 + sq, -0.5 * a1 - sq], dtype=complex)
+
+    # First-order numerator: single zero (or none if degenerate).
+    zeros = np.array([-b0 / b1], dtype=float) if b1 != 0.0 else np.array([], dtype=complex)
     return poles, zeros
 
 
@@ -5,6 +5,8 @@ from typing import Dict, Tuple
 
 import numpy as np
 
+from cardio._numba import NUMBA_AVAILABLE, njit, prange
+
 
 def _last_cycle_mask(t: np.ndarray, Tcc: float) -> np.ndarray:
     """
@@ -23,19 +25,185 @@ def _last_cycle_mask(t: np.ndarray, Tcc: float) -> np.ndarray:
     return t >= start
 
 
+def _last_cycle_slice(t: np.ndarray, Tcc: float) -> slice:
+    """
+    Return a slice selecting the last cardiac cycle in t.
+
+    Equivalent to _last_cycle_mask for non-decreasing t (the solver output),
+    but slicing returns views instead of gathering copies of every signal.
+    """
+    t = np.asarray(t, dtype=float).reshape(-1)
+    if t.size < 2:
+        raise ValueError("t must have at least 2 samples.")
+    if Tcc <= 0:
+        raise ValueError("Tcc must be > 0.")
+
+    start = int(np.searchsorted(t, t[-1] - Tcc, side="left"))
+    return slice(start, None)
+
+
+def _as_signal(y: np.ndarray) -> np.ndarray:
+    """
+    Return y as a floating-point array without changing its precision.
+
+    float32 signals (SimulationConfig.signal_dtype) are reduced as-is; the
+    kernels accumulate in float64. Non-float inputs are converted to float64.
+    """
+    y = np.asarray(y)
+    if y.dtype.kind != "f":
+        y = y.astype(float)
+    return y
+
+
+@njit(cache=True)
+def _trapz_loop(y, t):
+    """Trapezoidal integral of y dt in a single stride-one pass (no temporaries)."""
+    s = 0.0
+    for i in range(1, y.size):
+        s += (y[i] + y[i - 1]) * (t[i] - t[i - 1])
+    return 0.5 * s
+
+
+@njit(cache=True)
+def _reduce_stats_loop(y, t):
+    """
+    Single pass over (y, t) returning (max(y), min(y), trapezoidal area of y dt).
+
+    A NaN sample gives NaN for all three, as np.max/np.min/np.trapz would
+    (a diverged run must not produce finite-looking metrics).
+    """
+    ymax = y[0]
+    ymin = y[0]
+    if np.isnan(ymax):
+        return np.nan, np.nan, np.nan
+    area = 0.0
+    for i in range(1, y.size):
+        yi = y[i]
+        if np.isnan(yi):
+            return np.nan, np.nan, np.nan
+        if yi > ymax:
+            ymax = yi
+        if yi < ymin:
+            ymin = yi
+        area += 0.5 * (yi + y[i - 1]) * (t[i] - t[i - 1])
+    return ymax, ymin, area
+
+
+@njit(cache=True)
+def _open_duration_loop(flow, t, thr):
+    """
+    Total duration of the intervals [t[i-1], t[i]] where flow exceeds thr at both ends.
+
+    Branchless single pass: the boolean product acts as a 0/1 weight on dt.
+    """
+    acc = 0.0
+    prev_open = flow[0] > thr
+    for i in range(1, flow.size):
+        cur = flow[i] > thr
+        acc += (t[i] - t[i - 1]) * (prev_open & cur)
+        prev_open = cur
+    return acc
+
+
+@njit(cache=True, parallel=True)
+def _reduce_stats_batch_loop(Y, t, out_max, out_min, out_area):
+    """Row-wise _reduce_stats over Y (M, N), rows processed in parallel."""
+    for m in prange(Y.shape[0]):
+        ymax, ymin, area = _reduce_stats_loop(Y[m], t)
+        out_max[m] = ymax
+        out_min[m] = ymin
+        out_area[m] = area
+
+
+@njit(cache=True, parallel=True)
+def _valve_timing_batch_loop(F, t, rel_threshold, out_peak, out_t_peak, out_open):
+    """Row-wise peak, time of peak and open duration (see valve_timing_metrics)."""
+    for m in prange(F.shape[0]):
+        row = F[m]
+        idx = np.argmax(row)
+        peak = row[idx]
+        out_peak[m] = peak
+        if peak <= 0:
+            out_t_peak[m] = t[0]
+            out_open[m] = 0.0
+        else:
+            out_t_peak[m] = t[idx]
+            out_open[m] = _open_duration_loop(row, t, rel_threshold * peak)
+
+
+# The compiled loops above only pay off with Numba; without it they would run
+# per sample in Python, so the dispatchers below fall back to whole-array
+# NumPy reductions (same results, NaN propagating the same way).
+
+
+def _trapz(y: np.ndarray, t: np.ndarray) -> float:
+    """Trapezoidal integral of y dt."""
+    if NUMBA_AVAILABLE:
+        return _trapz_loop(y, t)
+    return np.trapz(y, t)
+
+
 def _trapz_mean(y: np.ndarray, t: np.ndarray) -> float:
     """Time-average using trapezoidal integration."""
-    y = np.asarray(y, dtype=float)
-    t = np.asarray(t, dtype=float)
+    y = np.ascontiguousarray(_as_signal(y))
+    t = np.ascontiguousarray(t, dtype=float)
     if y.size != t.size:
         raise ValueError("y and t must have same length.")
     duration = t[-1] - t[0]
     if duration <= 0:
         raise ValueError("Invalid time duration.")
-    area = np.trapz(y, t)
+    area = _trapz(y, t)
     return float(area / duration)
 
 
+def _reduce_stats(y: np.ndarray, t: np.ndarray) -> Tuple[float, float, float]:
+    """(max(y), min(y), trapezoidal area of y dt); NaN in y gives NaN for all three."""
+    if NUMBA_AVAILABLE:
+        return _reduce_stats_loop(y, t)
+    return np.max(y), np.min(y), np.trapz(y, t)
+
+
+def _open_duration(flow: np.ndarray, t: np.ndarray, thr: float) -> float:
+    """Total duration of the intervals [t[i-1], t[i]] where flow exceeds thr at both ends."""
+    if NUMBA_AVAILABLE:
+        return _open_duration_loop(flow, t, thr)
+    is_open = flow > thr
+    return np.diff(t)[is_open[1:] & is_open[:-1]].sum()
+
+
+def _reduce_stats_batch(Y, t, out_max, out_min, out_area) -> None:
+    """Row-wise _reduce_stats over Y (M, N), written to the (M,) outputs."""
+    if NUMBA_AVAILABLE:
+        _reduce_stats_batch_loop(Y, t, out_max, out_min, out_area)
+        return
+    np.max(Y, axis=1, out=out_max)
+    np.min(Y, axis=1, out=out_min)
+    out_area[:] = np.trapz(Y, t, axis=1)
+
+
+def _valve_timing_batch(F, t, rel_threshold, out_peak, out_t_peak, out_open) -> None:
+    """Row-wise peak, time of peak and open duration, written to the (M,) outputs."""
+    if NUMBA_AVAILABLE:
+        _valve_timing_batch_loop(F, t, rel_threshold, out_peak, out_t_peak, out_open)
+        return
+    idx = np.argmax(F, axis=1)
+    out_peak[:] = F[np.arange(F.shape[0]), idx]
+    closed = out_peak <= 0
+    is_open = F > (rel_threshold * out_peak)[:, None]
+    out_open[:] = (is_open[:, 1:] & is_open[:, :-1]) @ np.diff(t)
+    out_open[closed] = 0.0
+    out_t_peak[:] = np.where(closed, t[0], t[idx])
+
+
+def _segment_stats(y: np.ndarray, t: np.ndarray) -> Tuple[float, float, float]:
+    """Return (max, min, time-average) of y over t, computed in one pass."""
+    duration = t[-1] - t[0]
+    if duration <= 0:
+        raise ValueError("Invalid time duration.")
+    ymax, ymin, area = _reduce_stats(y, t)
+    return float(ymax), float(ymin), float(area / duration)
+
+
 def arterial_pressure_metrics(p1: np.ndarray, t: np.ndarray) -> Dict[str, float]:
     """
     Basic arterial pressure metrics computed on the provided segment.
@@ -46,15 +214,13 @@ def arterial_pressure_metrics(p1: np.ndarray, t: np.ndarray) -> Dict[str, float]
       - PP : pulse pressure (SBP-DBP)
       - MAP: mean arterial pressure (time average)
     """
-    p1 = np.asarray(p1, dtype=float).reshape(-1)
+    p1 = _as_signal(p1).reshape(-1)
     t = np.asarray(t, dtype=float).reshape(-1)
     if p1.size != t.size:
         raise ValueError("p1 and t must have same length.")
 
-    sbp = float(np.max(p1))
-    dbp = float(np.min(p1))
+    sbp, dbp, map_ = _segment_stats(p1, t)
     pp = sbp - dbp
-    map_ = _trapz_mean(p1, t)
 
     return {"SBP": sbp, "DBP": dbp, "PP": pp, "MAP": map_}
 
@@ -71,13 +237,13 @@ def stroke_volume(Vlv: np.ndarray, t: np.ndarray) -> Dict[str, float]:
       - Vmax
       - Vmin
     """
-    Vlv = np.asarray(Vlv, dtype=float).reshape(-1)
+    Vlv = _as_signal(Vlv).reshape(-1)
     t = np.asarray(t, dtype=float).reshape(-1)
     if Vlv.size != t.size:
         raise ValueError("Vlv and t must have same length.")
 
-    vmax = float(np.max(Vlv))
-    vmin = float(np.min(Vlv))
+    vmax, vmin, _ = _reduce_stats(Vlv, t)
+    vmax, vmin = float(vmax), float(vmin)
     sv = vmax - vmin
     return {"SV": sv, "Vmax": vmax, "Vmin": vmin}
 
@@ -90,16 +256,13 @@ def ventricular_pressure_metrics(pLV: np.ndarray, t: np.ndarray) -> Dict[str, fl
       - pLV_min
       - pLV_mean (time average)
     """
-    pLV = np.asarray(pLV, dtype=float).reshape(-1)
+    pLV = _as_signal(pLV).reshape(-1)
     t = np.asarray(t, dtype=float).reshape(-1)
     if pLV.size != t.size:
         raise ValueError("pLV and t must have same length.")
 
-    return {
-        "pLV_max": float(np.max(pLV)),
-        "pLV_min": float(np.min(pLV)),
-        "pLV_mean": _trapz_mean(pLV, t),
-    }
+    pmax, pmin, pmean = _segment_stats(pLV, t)
+    return {"pLV_max": pmax, "pLV_min": pmin, "pLV_mean": pmean}
 
 
 def flow_metrics(Q2: np.ndarray, t: np.ndarray) -> Dict[str, float]:
@@ -111,14 +274,12 @@ def flow_metrics(Q2: np.ndarray, t: np.ndarray) -> Dict[str, float]:
       - Q2_min
       - Q2_amp (half peak-to-peak)
     """
-    Q2 = np.asarray(Q2, dtype=float).reshape(-1)
+    Q2 = _as_signal(Q2).reshape(-1)
     t = np.asarray(t, dtype=float).reshape(-1)
     if Q2.size != t.size:
         raise ValueError("Q2 and t must have same length.")
 
-    qmax = float(np.max(Q2))
-    qmin = float(np.min(Q2))
-    qmean = _trapz_mean(Q2, t)
+    qmax, qmin, qmean = _segment_stats(Q2, t)
     qamp = 0.5 * (qmax - qmin)
     return {"Q2_mean": qmean, "Q2_max": qmax, "Q2_min": qmin, "Q2_amp": qamp}
 
@@ -140,31 +301,28 @@ def valve_timing_metrics(
       - open_duration: total time where valve is considered open
       - open_fraction: open_duration / cycle_duration
     """
-    flow = np.asarray(flow, dtype=float).reshape(-1)
+    flow = _as_signal(flow).reshape(-1)
     t = np.asarray(t, dtype=float).reshape(-1)
     if flow.size != t.size:
         raise ValueError("flow and t must have same length.")
     if rel_threshold <= 0:
         raise ValueError("rel_threshold must be > 0.")
 
-    peak = float(np.max(flow))
+    # argmax gives both the peak value and its location in a single pass
+    idx_peak = int(np.argmax(flow))
+    peak = float(flow[idx_peak])
     if peak <= 0:
         # Valve effectively never opens
         return {"peak": peak, "t_peak": float(t[0]), "open_duration": 0.0, "open_fraction": 0.0}
 
     thr = rel_threshold * peak
-    is_open = flow > thr
 
-    # total open duration via trapezoidal integration on boolean mask
-    # (approximate: sum of dt where open)
-    dt = np.diff(t)
+    # total open duration (approximate: sum of dt where open)
     # For each interval [i,i+1], consider open if both endpoints open
-    open_intervals = is_open[:-1] & is_open[1:]
-    open_duration = float(np.sum(dt[open_intervals]))
+    open_duration = float(_open_duration(flow, t, thr))
     cycle_duration = float(t[-1] - t[0])
     open_fraction = open_duration / cycle_duration if cycle_duration > 0 else 0.0
 
-    idx_peak = int(np.argmax(flow))
     t_peak = float(t[idx_peak])
 
     return {"peak": peak, "t_peak": t_peak, "open_duration": open_duration, "open_fraction": open_fraction}
@@ -190,15 +348,15 @@ def compute_all_metrics(
         raise KeyError(f"Missing required signals: {missing}")
 
     t = np.asarray(t, dtype=float).reshape(-1)
-    mask = _last_cycle_mask(t, Tcc)
+    sl = _last_cycle_slice(t, Tcc)
 
-    t_seg = t[mask]
-    p1_seg = signals["p1"][mask]
-    pLV_seg = signals["pLV"][mask]
-    Vlv_seg = signals["Vlv"][mask]
-    Q2_seg = signals["Q2"][mask]
-    P0_seg = signals["P0"][mask]
-    P1_seg = signals["P1"][mask]
+    t_seg = t[sl]
+    p1_seg = signals["p1"][sl]
+    pLV_seg = signals["pLV"][sl]
+    Vlv_seg = signals["Vlv"][sl]
+    Q2_seg = signals["Q2"][sl]
+    P0_seg = signals["P0"][sl]
+    P1_seg = signals["P1"][sl]
 
     out: Dict[str, float] = {}
 
@@ -214,3 +372,93 @@ def compute_all_metrics(
     out.update({f"AV_{k}": v for k, v in av.items()})
 
     return out
+
+
+def _as_batch(Y: np.ndarray, t: np.ndarray, name: str) -> np.ndarray:
+    """Validate and return a (M, N) float array matching t (N,)."""
+    Y = _as_signal(Y)
+    if Y.ndim != 2 or Y.shape[1] != t.size:
+        raise ValueError(f"{name} must have shape (M, N) with N = len(t).")
+    return Y
+
+
+def valve_timing_metrics_batch(
+    flow: np.ndarray,
+    t: np.ndarray,
+    rel_threshold: float = 0.01,
+) -> Dict[str, np.ndarray]:
+    """
+    Batched valve_timing_metrics for M flow waveforms sharing the time vector t.
+
+    flow has shape (M, N). Returns the same keys as valve_timing_metrics, each
+    mapped to an (M,) array. Rows are processed in parallel when Numba is
+    available.
+    """
+    t = np.asarray(t, dtype=float).reshape(-1)
+    flow = _as_batch(flow, t, "flow")
+    if rel_threshold <= 0:
+        raise ValueError("rel_threshold must be > 0.")
+
+    M = flow.shape[0]
+    peak = np.empty(M)
+    t_peak = np.empty(M)
+    open_duration = np.empty(M)
+    _valve_timing_batch(flow, t, float(rel_threshold), peak, t_peak, open_duration)
+
+    cycle_duration = float(t[-1] - t[0])
+    open_fraction = open_duration / cycle_duration if cycle_duration > 0 else np.zeros(M)
+    return {"peak": peak, "t_peak": t_peak, "open_duration": open_duration, "open_fraction": open_fraction}
+
+
+def compute_all_metrics_batch(
+    signals_batch: Dict[str, np.ndarray],
+    t: np.ndarray,
+    Tcc: float,
+    valve_threshold: float = 0.01,
+) -> Dict[str, np.ndarray]:
+    """
+    Batched compute_all_metrics for M runs sampled on the same time grid.
+
+    Each entry of signals_batch has shape (M, N) (one row per run, e.g. a
+    parameter sweep). Returns the same keys as compute_all_metrics, each mapped
+    to an (M,) array. Rows are processed in parallel when Numba is available.
+    """
+    required = ("p1", "pLV", "Vlv", "Q2", "P0", "P1")
+    missing = [k for k in required if k not in signals_batch]
+    if missing:
+        raise KeyError(f"Missing required signals: {missing}")
+
+    t = np.asarray(t, dtype=float).reshape(-1)
+    sl = _last_cycle_slice(t, Tcc)
+    t_seg = t[sl]
+    duration = t_seg[-1] - t_seg[0]
+    if duration <= 0:
+        raise ValueError("Invalid time duration.")
+
+    def stats(name: str) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        Y = _as_batch(signals_batch[name], t, name)[:, sl]
+        M = Y.shape[0]
+        ymax, ymin, area = np.empty(M), np.empty(M), np.empty(M)
+        _reduce_stats_batch(Y, t_seg, ymax, ymin, area)
+        return ymax, ymin, area / duration
+
+    out: Dict[str, np.ndarray] = {}
+
+    sbp, dbp, map_ = stats("p1")
+    out.update({"p1_SBP": sbp, "p1_DBP": dbp, "p1_PP": sbp - dbp, "p1_MAP": map_})
+
+    pmax, pmin, pmean = stats("pLV")
+    out.update({"pLV_max": pmax, "pLV_min": pmin, "pLV_mean": pmean})
+
+    vmax, vmin, _ = stats("Vlv")
+    out.update({"SV": vmax - vmin, "Vmax": vmax, "Vmin": vmin})
+
+    qmax, qmin, qmean = stats("Q2")
+    out.update({"Q2_mean": qmean, "Q2_max": qmax, "Q2_min": qmin, "Q2_amp": 0.5 * (qmax - qmin)})
+
+    for prefix, name in (("MV", "P0"), ("AV", "P1")):
+        flow = _as_batch(signals_batch[name], t, name)[:, sl]
+        vt = valve_timing_metrics_batch(flow, t_seg, rel_threshold=valve_threshold)
+        out.update({f"{prefix}_{k}": v for k, v in vt.items()})
+
+    return out
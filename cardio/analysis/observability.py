@@ -40,13 +40,14 @@ def observability_matrix(A: np.ndarray, C: np.ndarray) -> np.ndarray:
     if C.shape[1] != n:
         raise ValueError("C must have shape (p, n).")
 
-    blocks = []
-    CAk = C.copy()
-    for _ in range(n):
-        blocks.append(CAk)
-        CAk = CAk @ A
+    # Fill the blocks C A^k in place: block k = block (k-1) @ A.
+    p = C.shape[0]
+    O = np.empty((p * n, n), dtype=float)
+    O[:p] = C
+    for k in range(1, n):
+        np.dot(O[(k - 1) * p:k * p], A, out=O[k * p:(k + 1) * p])
 
-    return np.vstack(blocks)
+    return O
 
 
 def observability_checks(A: np.ndarray, C: np.ndarray, tol: float | None = None) -> ObservabilityReport:
@@ -54,14 +55,20 @@ def observability_checks(A: np.ndarray, C: np.ndarray, tol: float | None = None)
     Compute rank, determinant (if square), and condition number of the observability matrix.
 
     tol:
-        Optional tolerance passed to np.linalg.matrix_rank.
+        Optional singular-value threshold for the rank (same default as
+        np.linalg.matrix_rank).
     """
     O = observability_matrix(A, C)
 
-    rank = int(np.linalg.matrix_rank(O, tol=tol))
+    # One SVD for both rank and condition number (same rules as
+    # np.linalg.matrix_rank and np.linalg.cond).
+    sv = linalg.svdvals(O)
+    if tol is None:
+        tol = sv[0] * max(O.shape) * np.finfo(O.dtype).eps
+    rank = int(np.count_nonzero(sv > tol))
     # det only defined if O is square (happens when p=1)
     det_val = float(np.linalg.det(O)) if O.shape[0] == O.shape[1] else None
-    cond_val = float(np.linalg.cond(O))
+    cond_val = float(sv[0] / sv[-1]) if sv[-1] > 0 else float("inf")
 
     return ObservabilityReport(O=O, rank=rank, det=det_val, cond=cond_val)
 
@@ -78,15 +85,46 @@ def observability_gramian_continuous(A: np.ndarray, C: np.ndarray) -> np.ndarray
 
     Q = C.T @ C
     # Solve A^T W + W A = -Q
+    if A.shape == (2, 2):
+        return _lyapunov_2x2(A, Q)
     W = linalg.solve_continuous_lyapunov(A.T, -Q)
     return W
 
 
+def _lyapunov_2x2(A: np.ndarray, Q: np.ndarray) -> np.ndarray:
+    """
+    Closed-form solution of A^T W + W A + Q = 0 for 2x2 A:
+
+        W = -(det(A) Q + M^T Q M) / (2 tr(A) det(A)),   M = A - tr(A) I
+
+    Unique iff tr(A) != 0 and det(A) != 0 (always true for Hurwitz A).
+    """
+    tr = A[0, 0] + A[1, 1]
+    det = A[0, 0] * A[1, 1] - A[0, 1] * A[1, 0]
+    if tr == 0.0 or det == 0.0:
+        # no unique solution; defer to LAPACK for the error/least-squares behaviour
+        return linalg.solve_continuous_lyapunov(A.T, -Q)
+    M = A - tr * np.eye(2)
+    W = -(det * Q + M.T @ Q @ M) / (2.0 * tr * det)
+    return 0.5 * (W + W.T)
+
+
+def _eigvalsh_2x2(W: np.ndarray) -> np.ndarray:
+    """Eigenvalues of a symmetric 2x2 matrix in descending order (closed form)."""
+    a, b, d = W[0, 0], W[0, 1], W[1, 1]
+    half_tr = 0.5 * (a + d)
+    # sqrt(((a - d)/2)^2 + b^2) == sqrt(tr^2/4 - det), without the cancellation
+    sq = np.hypot(0.5 * (a - d), b)
+    return np.array([half_tr + sq, half_tr - sq])
+
+
 def observability_gramian_eigs(A: np.ndarray, C: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
     """
     Return (W_o, eigvals(W_o)) sorted descending.
     """
     W = observability_gramian_continuous(A, C)
+    if W.shape == (2, 2):
+        return W, _eigvalsh_2x2(W)
     eigs = np.linalg.eigvalsh(W)  # symmetric eigs
     eigs_sorted = np.sort(eigs)[::-1]
     return W, eigs_sorted
@@ -1,20 +1,64 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict
-
 import numpy as np
+from numpy.typing import DTypeLike
+
+from cardio._numba import NUMBA_AVAILABLE, njit, prange
+from cardio.models.systemic_nonlinear_nb import (
+    cycle_scalar,
+    decc_scalar,
+    ecc_scalar,
+    valve_flows_scalar,
+)
+from cardio.params.dataclasses import ParameterSet, SignalTable
+from cardio.physiology.compliance import clv_and_dclv
+from cardio.physiology.valves import aortic_flow, mitral_flow, valve_gate_code
+
+
+# Row order of the SignalTable returned by reconstruct_signals
+SIGNAL_NAMES = ("pLV", "Q2", "p1", "Clv", "dClv_dt", "Elv", "P0", "P1", "Vlv")
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def _compliance_signals(t, pLV, Tcc, Cmax, Cmin, Vr, out_c, out_dc, out_e, out_v):
+    """
+    Fill C_LV, dC_LV/dt, E_LV and V_LV = Vr + C_LV*pLV in a single pass over t.
+
+    Same equations as cardio.physiology.compliance, evaluated once per sample
+    (the activation phase is shared by all four outputs).
+    """
+    A = (1.0 / Cmin) - (1.0 / Cmax)
+    B = 1.0 / Cmax
+    for i in prange(t.size):
+        tau, Tvc, Tvr = cycle_scalar(t[i], Tcc)
+        denom = A * ecc_scalar(tau, Tvc, Tvr) + B
+        C = 1.0 / denom
+        out_c[i] = C
+        out_dc[i] = -(A * decc_scalar(tau, Tvc, Tvr)) * C * C
+        out_e[i] = denom
+        out_v[i] = Vr + C * pLV[i]
 
-from cardio.params.dataclasses import ParameterSet
-from cardio.physiology.compliance import clv, dclv_dt, elv
-from cardio.physiology.valves import aortic_flow, mitral_flow
+
+@njit(cache=True, fastmath=True, parallel=True)
+def _valve_signals(pLV, p1, pLA, RMV, RAV, k, gate, out_p0, out_p1):
+    """
+    Fill mitral (P0) and aortic (P1) flows in a single pass.
+
+    Same equations as cardio.physiology.valves.{mitral_flow, aortic_flow}.
+    """
+    for i in prange(pLV.size):
+        P0, P1 = valve_flows_scalar(pLA, pLV[i], p1[i], RMV, RAV, k, gate)
+        out_p0[i] = P0
+        out_p1[i] = P1
 
 
 def reconstruct_signals(
     t: np.ndarray,
     x: np.ndarray,
     params: ParameterSet,
-) -> Dict[str, np.ndarray]:
+    dtype: DTypeLike = np.float64,
+) -> SignalTable:
     """
     Reconstruct derived signals from simulation states.
 
@@ -25,9 +69,14 @@ def reconstruct_signals(
     x : (N,3) array
         State trajectory with columns [pLV, Q2, p1].
     params : ParameterSet
+    dtype : numpy dtype, optional
+        Storage precision of the returned signals (computations run in float64).
+
+    Outputs (SignalTable, read like a dict of arrays)
+    -------------------------------------------------
+    All signals are rows of one (len(SIGNAL_NAMES), N) buffer, so each is
+    contiguous and a run needs a single allocation:
 
-    Outputs (dict of arrays)
-    ------------------------
     - pLV : left ventricular pressure [mmHg]
     - Q2  : peripheral arterial flow [mL/s]
     - p1  : aortic/arterial pressure [mmHg]
@@ -50,27 +99,45 @@ def reconstruct_signals(
     Q2 = x[:, 1]
     p1 = x[:, 2]
 
-    # Compliance signals (vectorized)
-    Clv = clv(t, params)
-    dClv = dclv_dt(t, params)
-    Elv = elv(t, params)
-
-    # Valve flows (vectorized)
-    k = float(params.k_valve)
-    P0 = mitral_flow(params.pLA, pLV, params.RMV, k)
-    P1 = aortic_flow(pLV, p1, params.RAV, k)
-
-    # Volume reconstruction
-    Vlv = params.Vr + np.asarray(Clv, dtype=float) * pLV
-
-    return {
-        "pLV": np.asarray(pLV, dtype=float),
-        "Q2": np.asarray(Q2, dtype=float),
-        "p1": np.asarray(p1, dtype=float),
-        "Clv": np.asarray(Clv, dtype=float),
-        "dClv_dt": np.asarray(dClv, dtype=float),
-        "Elv": np.asarray(Elv, dtype=float),
-        "P0": np.asarray(P0, dtype=float),
-        "P1": np.asarray(P1, dtype=float),
-        "Vlv": np.asarray(Vlv, dtype=float),
-    }
+    if params.Tcc <= 0:
+        raise ValueError("Tcc must be > 0")
+
+    # One (K, N) buffer; every signal is a contiguous row, filled in place
+    # in the storage dtype.
+    buf = np.empty((len(SIGNAL_NAMES), t.shape[0]), dtype=dtype)
+    pLV_s, Q2_s, p1_s, Clv, dClv, Elv, P0, P1, Vlv = buf
+    pLV_s[:] = pLV
+    Q2_s[:] = Q2
+    p1_s[:] = p1
+
+    if params.RMV <= 0:
+        raise ValueError("RMV must be > 0")
+    if params.RAV <= 0:
+        raise ValueError("RAV must be > 0")
+    if params.k_valve <= 0:
+        raise ValueError("k must be > 0")
+
+    if NUMBA_AVAILABLE:
+        # Compliance signals and volume, then valve flows (one fused pass each)
+        _compliance_signals(
+            t, pLV, float(params.Tcc), float(params.Cmax), float(params.Cmin), float(params.Vr),
+            Clv, dClv, Elv, Vlv,
+        )
+        _valve_signals(
+            pLV, p1, float(params.pLA), float(params.RMV), float(params.RAV), float(params.k_valve),
+            valve_gate_code(params.valve_gate), P0, P1,
+        )
+    else:
+        # Without Numba the kernels would loop per sample in Python: use the
+        # vectorized physiology functions instead.
+        C, dC = clv_and_dclv(t, params)
+        Clv[:] = C
+        dClv[:] = dC
+        np.divide(1.0, C, out=Elv)
+        np.multiply(C, pLV, out=C)
+        C += params.Vr
+        Vlv[:] = C
+        P0[:] = mitral_flow(params.pLA, pLV, params.RMV, params.k_valve, gate=params.valve_gate)
+        P1[:] = aortic_flow(pLV, p1, params.RAV, params.k_valve, gate=params.valve_gate)
+
+    return SignalTable(buf, SIGNAL_NAMES)
@@ -1,10 +1,35 @@
 from __future__ import annotations
 
-import numpy as np
+from typing import Callable, Sequence
 
+import numpy as np
+from scipy.sparse import csr_matrix
+
+from cardio.models.systemic_nonlinear_nb import (
+    _jac_batch_call,
+    _jac_call,
+    _rhs_batch_call,
+    _rhs_call,
+    jac_nb,
+    rhs_args,
+    rhs_args_batched,
+    rhs_nb,
+)
 from cardio.params.dataclasses import ParameterSet
-from cardio.physiology.compliance import clv, dclv_dt
-from cardio.physiology.valves import aortic_flow, mitral_flow
+
+
+# Structural nonzeros of d[dpLV, dQ2, dp1]/d[pLV, Q2, p1]:
+#   dpLV <- pLV, p1    dQ2 <- Q2, p1    dp1 <- pLV, Q2, p1
+JAC_SPARSITY = csr_matrix(
+    np.array(
+        [
+            [1, 0, 1],
+            [0, 1, 1],
+            [1, 1, 1],
+        ],
+        dtype=bool,
+    )
+)
 
 
 def rhs(t: float, x: np.ndarray, params: ParameterSet) -> np.ndarray:
@@ -29,33 +54,89 @@ def rhs(t: float, x: np.ndarray, params: ParameterSet) -> np.ndarray:
       P1 = (pLV - p1)/RAV * H(pLV - p1)
 
     Notes:
-      - Total resistance uses the project rule: Rtot = 2*Rart (Rcap = Rart).
-      - H is smoothed using tanh with slope parameter k_valve.
+      - Total resistance is Rtot = Rart + Rcap (ParameterSet.Rtot).
+      - H is smoothed with slope parameter k_valve; its shape is selected by
+        params.valve_gate (tanh by default, see physiology.valves.VALVE_GATES;
+        "hard" uses the exact step, i.e. ideal diode valves).
+      - The right-hand side is evaluated by the compiled scalar kernel in
+        cardio.models.systemic_nonlinear_nb (same equations as the reference
+        physiology functions).
     """
     x = np.asarray(x, dtype=float).reshape(-1)
     if x.size != 3:
         raise ValueError("State x must have size 3: [pLV, Q2, p1]")
 
-    pLV, Q2, p1 = x
+    return rhs_nb(float(t), x, rhs_args(params))
+
+
+def make_rhs(params: ParameterSet) -> Callable[[float, np.ndarray], np.ndarray]:
+    """
+    Return f(t, x) evaluating `rhs` for fixed parameters, as expected by solve_ivp.
+
+    The ParameterSet is unpacked into plain floats once, when the closure is
+    built, instead of on every right-hand side evaluation, and the closure
+    calls the compiled entry point directly (one dispatch per evaluation).
+    Baking the floats in as compile-time constants would save little more per
+    call but cost a fresh compilation for every ParameterSet.
+    """
+    args = rhs_args(params)
 
-    # Time-varying ventricular compliance and its derivative
-    C_LV = float(clv(t, params))
-    dC_LV = float(dclv_dt(t, params))
+    def f(t: float, x: np.ndarray) -> np.ndarray:
+        return _rhs_call(t, x, args)
 
-    # Valve flows (smooth gating)
-    k = float(params.k_valve)
-    P0 = float(mitral_flow(params.pLA, pLV, params.RMV, k))
-    P1 = float(aortic_flow(pLV, p1, params.RAV, k))
+    return f
+
+
+def jac(t: float, x: np.ndarray, params: ParameterSet) -> np.ndarray:
+    """
+    Analytical Jacobian of `rhs` with respect to x = [pLV, Q2, p1].
+
+    Returns a dense (3,3) array J[i, j] = d(dx_i/dt)/dx_j. Valve terms use the
+    exact derivative of the smoothed gate (sech^2 for "tanh"); C_LV(t) does not
+    depend on the state. Zero entries follow JAC_SPARSITY.
+    """
+    x = np.asarray(x, dtype=float).reshape(-1)
+    if x.size != 3:
+        raise ValueError("State x must have size 3: [pLV, Q2, p1]")
 
-    # Eq.56: dpLV/dt
-    dpLV_dt = (-pLV * dC_LV + P0 - P1) / C_LV
+    return jac_nb(float(t), x, rhs_args(params))
 
-    # # Eq.57: dQ2/dt
-    # dQ2_dt = (p1 - params.pRA - params.Rtot * Q2) / params.Iart
-    Rtot = params.Rcap + params.Rart
-    dQ2_dt = (p1 - params.pRA - Rtot * Q2) / params.Iart
 
-    # Eq.58: dp1/dt
-    dp1_dt = (P1 - Q2) / params.Cart
+def make_jac(params: ParameterSet) -> Callable[[float, np.ndarray], np.ndarray]:
+    """
+    Return J(t, x) evaluating `jac` for fixed parameters, as expected by solve_ivp.
+    """
+    args = rhs_args(params)
+
+    def J(t: float, x: np.ndarray) -> np.ndarray:
+        return _jac_call(t, x, args)
+
+    return J
+
+
+def make_rhs_batched(params_list: Sequence[ParameterSet]) -> Callable[[float, np.ndarray], np.ndarray]:
+    """
+    Return f(t, y) for K independent systems stacked in one state vector.
+
+    y has shape (3K,) with y[3k:3k+3] = [pLV, Q2, p1] for params_list[k]. All
+    K right-hand sides are evaluated in one compiled call, so the Python and
+    solver overhead per evaluation is shared by the whole parameter sweep.
+    """
+    P, gates = rhs_args_batched(params_list)
+
+    def f(t: float, y: np.ndarray) -> np.ndarray:
+        return _rhs_batch_call(t, y, P, gates)
+
+    return f
+
+
+def make_jac_batched(params_list: Sequence[ParameterSet]) -> Callable[[float, np.ndarray], np.ndarray]:
+    """
+    Return J(t, y), the block-diagonal (3K, 3K) Jacobian of `make_rhs_batched`.
+    """
+    P, gates = rhs_args_batched(params_list)
+
+    def J(t: float, y: np.ndarray) -> np.ndarray:
+        return _jac_batch_call(t, y, P, gates)
 
-    return np.array([dpLV_dt, dQ2_dt, dp1_dt], dtype=float)
+    return J
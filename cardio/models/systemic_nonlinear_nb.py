@@ -0,0 +1,333 @@
+"""
+Compiled scalar kernels for the nonlinear systemic model (Eq.56–58).
+
+These mirror cardio.physiology.{activation, compliance, valves} for a single
+time instant, using only floats and the `math` module so they can be compiled
+by Numba. The ODE solver calls the right-hand side tens of thousands of times
+per simulation, so keeping it free of Python attribute lookups and temporary
+arrays dominates total wall-clock time.
+
+cycle_scalar, ecc_scalar, decc_scalar and valve_flows_scalar are public
+because cardio.models.signals builds its compiled reconstruction kernels on
+them. Without Numba, signal reconstruction uses the vectorized NumPy
+implementations in cardio.physiology instead. Those remain the reference
+the kernels are tested against.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Sequence, Tuple
+
+import numpy as np
+
+from cardio._numba import njit
+from cardio.params.dataclasses import ParameterSet
+from cardio.physiology.valves import valve_gate_code
+
+
+# Reference cycle duration used by tvc_tvr (Eq.63–64).
+_TCC_REF = 6.0 / 7.0
+
+
+@njit(cache=True, fastmath=True)
+def cycle_scalar(t, Tcc):
+    """Return (tau, Tvc, Tvr) for absolute time t."""
+    tau = t - Tcc * math.floor(t / Tcc)
+    scale = Tcc / _TCC_REF
+    return tau, 0.3 * scale, 0.15 * scale
+
+
+@njit(cache=True, fastmath=True)
+def ecc_scalar(tau, Tvc, Tvr):
+    """Activation e_cc(tau) (Eq.60–62)."""
+    if tau < 0.0:
+        return 0.0
+    if tau <= Tvc:
+        return 0.5 * (1.0 - math.cos(math.pi * tau / Tvc))
+    if tau <= Tvc + Tvr:
+        return 0.5 * (1.0 + math.cos(math.pi * (tau - Tvc) / Tvr))
+    return 0.0
+
+
+@njit(cache=True, fastmath=True)
+def decc_scalar(tau, Tvc, Tvr):
+    """Time derivative of e_cc(tau)."""
+    if tau < 0.0:
+        return 0.0
+    if tau <= Tvc:
+        return (math.pi / (2.0 * Tvc)) * math.sin(math.pi * tau / Tvc)
+    if tau <= Tvc + Tvr:
+        return -(math.pi / (2.0 * Tvr)) * math.sin(math.pi * (tau - Tvc) / Tvr)
+    return 0.0
+
+
+@njit(cache=True, fastmath=True)
+def _clv_dclv_scalar(t, Tcc, Cmax, Cmin):
+    """
+    Ventricular compliance C_LV(t) (Eq.59) and dC_LV/dt = -A * de/dt * C_LV^2,
+    sharing the cycle phase, activation and denominator.
+    """
+    tau, Tvc, Tvr = cycle_scalar(t, Tcc)
+    A = (1.0 / Cmin) - (1.0 / Cmax)
+    B = 1.0 / Cmax
+    C = 1.0 / (A * ecc_scalar(tau, Tvc, Tvr) + B)
+    return C, -(A * decc_scalar(tau, Tvc, Tvr)) * C * C
+
+
+@njit(cache=True, fastmath=True)
+def _gate_scalar(z, gate):
+    """
+    Smooth Heaviside H evaluated at z = k*dp; gate is the code from VALVE_GATES.
+
+    0: tanh       (1 + tanh(z)) / 2
+    1: algebraic  (1 + z / sqrt(1 + z^2)) / 2   (no transcendental call)
+    2: rational   (1 + z / (1 + |z|)) / 2
+    3: hard       1 if z > 0 else 0
+    """
+    if gate == 1:
+        return 0.5 + 0.5 * z / math.sqrt(1.0 + z * z)
+    if gate == 2:
+        return 0.5 + 0.5 * z / (1.0 + abs(z))
+    if gate == 3:
+        return 1.0 if z > 0.0 else 0.0
+    return 0.5 * (1.0 + math.tanh(z))
+
+
+@njit(cache=True, fastmath=True)
+def _dgate_scalar(z, gate):
+    """
+    dH/dz of _gate_scalar: sech^2(z)/2 (tanh), (1 + z^2)^(-3/2)/2 (algebraic),
+    (1 + |z|)^(-2)/2 (rational), 0 (hard, away from z = 0).
+    """
+    if gate == 1:
+        r = 1.0 / math.sqrt(1.0 + z * z)
+        return 0.5 * r * r * r
+    if gate == 2:
+        r = 1.0 / (1.0 + abs(z))
+        return 0.5 * r * r
+    if gate == 3:
+        return 0.0
+    th = math.tanh(z)
+    return 0.5 * (1.0 - th * th)
+
+
+@njit(cache=True, fastmath=True)
+def _valve_conductance(dp, R, k, gate):
+    """
+    d/d(dp) of the valve flow (dp/R) * H(k*dp):  (H + k*dp*H') / R.
+    """
+    z = k * dp
+    return (_gate_scalar(z, gate) + z * _dgate_scalar(z, gate)) / R
+
+
+@njit(cache=True, fastmath=True)
+def _mitral_scalar(pLA, pLV, RMV, k, gate):
+    """Mitral inflow P0 = (pLA - pLV)/RMV * H(pLA - pLV)."""
+    dp = pLA - pLV
+    return (dp / RMV) * _gate_scalar(k * dp, gate)
+
+
+@njit(cache=True, fastmath=True)
+def _aortic_scalar(pLV, p1, RAV, k, gate):
+    """Aortic outflow P1 = (pLV - p1)/RAV * H(pLV - p1)."""
+    dp = pLV - p1
+    return (dp / RAV) * _gate_scalar(k * dp, gate)
+
+
+@njit(cache=True, fastmath=True)
+def valve_flows_scalar(pLA, pLV, p1, RMV, RAV, k, gate):
+    """Fused mitral and aortic flows (P0, P1) for one instant."""
+    return _mitral_scalar(pLA, pLV, RMV, k, gate), _aortic_scalar(pLV, p1, RAV, k, gate)
+
+
+@njit(cache=True, fastmath=True)
+def _rhs_kernel(
+    t, pLV, Q2, p1,
+    Tcc, Cmax, Cmin, pLA, pRA, RMV, RAV, Cart, Iart, Rtot, k_valve, gate,
+    out,
+):
+    """Evaluate Eq.56–58 at a single instant and write [dpLV, dQ2, dp1] into out."""
+    C_LV, dC_LV = _clv_dclv_scalar(t, Tcc, Cmax, Cmin)
+
+    P0, P1 = valve_flows_scalar(pLA, pLV, p1, RMV, RAV, k_valve, gate)
+
+    out[0] = (-pLV * dC_LV + P0 - P1) / C_LV
+    out[1] = (p1 - pRA - Rtot * Q2) / Iart
+    out[2] = (P1 - Q2) / Cart
+
+
+@njit(cache=True, fastmath=True)
+def _jac_kernel(
+    t, pLV, Q2, p1,
+    Tcc, Cmax, Cmin, pLA, pRA, RMV, RAV, Cart, Iart, Rtot, k_valve, gate,
+    out,
+):
+    """
+    Analytical Jacobian d[dpLV, dQ2, dp1]/d[pLV, Q2, p1] written into out (3x3).
+
+    Structural zeros (see JAC_SPARSITY): dpLV does not depend on Q2 and dQ2
+    does not depend on pLV.
+    """
+    C_LV, dC_LV = _clv_dclv_scalar(t, Tcc, Cmax, Cmin)
+
+    g0 = _valve_conductance(pLA - pLV, RMV, k_valve, gate)  # dP0/d(pLA - pLV)
+    g1 = _valve_conductance(pLV - p1, RAV, k_valve, gate)  # dP1/d(pLV - p1)
+
+    out[0, 0] = (-dC_LV - g0 - g1) / C_LV
+    out[0, 1] = 0.0
+    out[0, 2] = g1 / C_LV
+
+    out[1, 0] = 0.0
+    out[1, 1] = -Rtot / Iart
+    out[1, 2] = 1.0 / Iart
+
+    out[2, 0] = g1 / Cart
+    out[2, 1] = -1.0 / Cart
+    out[2, 2] = -g1 / Cart
+
+
+@njit(cache=True, fastmath=True)
+def _rhs_call(t, x, args):
+    """
+    Unpack (x, args) and allocate the result inside compiled code, so a
+    right-hand side evaluation is a single dispatch from Python.
+
+    A fresh array is returned on every call: solve_ivp keeps references to
+    earlier evaluations (e.g. the derivative at the last accepted step), so
+    a shared output buffer is not safe.
+    """
+    Tcc, Cmax, Cmin, pLA, pRA, RMV, RAV, Cart, Iart, Rtot, k_valve, gate = args
+    out = np.empty(3)
+    _rhs_kernel(
+        t, x[0], x[1], x[2],
+        Tcc, Cmax, Cmin, pLA, pRA, RMV, RAV, Cart, Iart, Rtot, k_valve, gate,
+        out,
+    )
+    return out
+
+
+@njit(cache=True, fastmath=True)
+def _jac_call(t, x, args):
+    """Jacobian counterpart of _rhs_call."""
+    Tcc, Cmax, Cmin, pLA, pRA, RMV, RAV, Cart, Iart, Rtot, k_valve, gate = args
+    out = np.empty((3, 3))
+    _jac_kernel(
+        t, x[0], x[1], x[2],
+        Tcc, Cmax, Cmin, pLA, pRA, RMV, RAV, Cart, Iart, Rtot, k_valve, gate,
+        out,
+    )
+    return out
+
+
+@njit(cache=True, fastmath=True)
+def _rhs_batch_call(t, y, P, gates):
+    """
+    Right-hand side of K independent systems stacked as y[3*k:3*k+3].
+
+    P is the (K, 11) float table from rhs_args_batched (the float part of
+    rhs_args, row k for system k) and gates the (K,) gate codes.
+    """
+    out = np.empty(y.size)
+    for k in range(P.shape[0]):
+        j = 3 * k
+        _rhs_kernel(
+            t, y[j], y[j + 1], y[j + 2],
+            P[k, 0], P[k, 1], P[k, 2], P[k, 3], P[k, 4], P[k, 5],
+            P[k, 6], P[k, 7], P[k, 8], P[k, 9], P[k, 10], gates[k],
+            out[j:j + 3],
+        )
+    return out
+
+
+@njit(cache=True, fastmath=True)
+def _jac_batch_call(t, y, P, gates):
+    """Block-diagonal (3K, 3K) Jacobian counterpart of _rhs_batch_call."""
+    out = np.zeros((y.size, y.size))
+    for k in range(P.shape[0]):
+        j = 3 * k
+        _jac_kernel(
+            t, y[j], y[j + 1], y[j + 2],
+            P[k, 0], P[k, 1], P[k, 2], P[k, 3], P[k, 4], P[k, 5],
+            P[k, 6], P[k, 7], P[k, 8], P[k, 9], P[k, 10], gates[k],
+            out[j:j + 3, j:j + 3],
+        )
+    return out
+
+
+def rhs_args(params: ParameterSet) -> Tuple[float | int, ...]:
+    """
+    Unpack a ParameterSet into the flat float tuple expected by `_rhs_kernel`.
+
+    Order: (Tcc, Cmax, Cmin, pLA, pRA, RMV, RAV, Cart, Iart, Rtot, k_valve, gate)
+    where gate is the integer code of params.valve_gate.
+    """
+    if params.Tcc <= 0:
+        raise ValueError("Tcc must be > 0")
+    if params.RMV <= 0:
+        raise ValueError("RMV must be > 0")
+    if params.RAV <= 0:
+        raise ValueError("RAV must be > 0")
+    if params.k_valve <= 0:
+        raise ValueError("k must be > 0")
+
+    return (
+        float(params.Tcc),
+        float(params.Cmax),
+        float(params.Cmin),
+        float(params.pLA),
+        float(params.pRA),
+        float(params.RMV),
+        float(params.RAV),
+        float(params.Cart),
+        float(params.Iart),
+        float(params.Rtot),
+        float(params.k_valve),
+        valve_gate_code(params.valve_gate),
+    )
+
+
+def rhs_nb(t: float, x: np.ndarray, args: Tuple[float | int, ...]) -> np.ndarray:
+    """
+    Evaluate the compiled right-hand side for pre-unpacked parameters.
+
+    `args` is the tuple returned by `rhs_args`.
+    """
+    return _rhs_call(t, x, args)
+
+
+def jac_nb(t: float, x: np.ndarray, args: Tuple[float | int, ...]) -> np.ndarray:
+    """
+    Evaluate the compiled analytical Jacobian for pre-unpacked parameters.
+
+    `args` is the tuple returned by `rhs_args`.
+    """
+    return _jac_call(t, x, args)
+
+
+def rhs_args_batched(params_list: Sequence[ParameterSet]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Stack rhs_args of several ParameterSets for the batched kernels.
+
+    Returns (P, gates): P is a (K, 11) float64 array whose rows are the float
+    part of rhs_args, gates the (K,) int64 valve gate codes.
+    """
+    if len(params_list) == 0:
+        raise ValueError("params_list must contain at least one ParameterSet.")
+    rows = [rhs_args(p) for p in params_list]
+    P = np.array([r[:-1] for r in rows], dtype=np.float64)
+    gates = np.array([r[-1] for r in rows], dtype=np.int64)
+    return P, gates
+
+
+def rhs_batched_nb(t: float, y: np.ndarray, P: np.ndarray, gates: np.ndarray) -> np.ndarray:
+    """
+    Evaluate K stacked right-hand sides; y is (3K,) with y[3k:3k+3] = [pLV, Q2, p1]
+    of system k and (P, gates) come from `rhs_args_batched`.
+    """
+    return _rhs_batch_call(t, y, P, gates)
+
+
+def jac_batched_nb(t: float, y: np.ndarray, P: np.ndarray, gates: np.ndarray) -> np.ndarray:
+    """Block-diagonal Jacobian of `rhs_batched_nb`, shape (3K, 3K)."""
+    return _jac_batch_call(t, y, P, gates)
@@ -1,14 +1,81 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any, Callable, Dict, Mapping, Optional, Sequence
+from typing import Any, Callable, Dict, Iterator, Mapping, Optional, Sequence
 
 import numpy as np
+from numpy.typing import DTypeLike
 
 
 ArrayLike = np.ndarray
 
 
+class _FrozenMeta(Mapping[str, Any]):
+    """
+    Read-only mapping used for ParameterSet.meta.
+
+    Unlike types.MappingProxyType it can be pickled (ParameterSet instances are
+    sent to worker processes) and it compares equal to any mapping with the
+    same items.
+    """
+
+    __slots__ = ("_data",)
+
+    def __init__(self, data: Mapping[str, Any] | None = None) -> None:
+        self._data = dict(data or {})
+
+    def __getitem__(self, key: str) -> Any:
+        return self._data[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __repr__(self) -> str:
+        return repr(self._data)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return self._data
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self._data = state
+
+
+class SignalTable(Mapping[str, np.ndarray]):
+    """
+    Read-only mapping of named signals stored in one (K, N) buffer.
+
+    Each signal is a contiguous row of `array`; table["p1"] returns a view of
+    that row (one dict lookup, no copy). Code that takes a dict of signals
+    works unchanged, while all signals of a run share a single allocation.
+    """
+
+    __slots__ = ("array", "columns")
+
+    def __init__(self, array: np.ndarray, names: Sequence[str]) -> None:
+        if array.ndim != 2 or array.shape[0] != len(names):
+            raise ValueError("array must have shape (len(names), N).")
+        self.array = array
+        self.columns = {name: i for i, name in enumerate(names)}
+
+    def __getitem__(self, key: str) -> np.ndarray:
+        return self.array[self.columns[key]]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.columns
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.columns)
+
+    def __len__(self) -> int:
+        return len(self.columns)
+
+    def __repr__(self) -> str:
+        return f"SignalTable({list(self.columns)}, shape={self.array.shape}, dtype={self.array.dtype})"
+
+
 @dataclass(frozen=True)
 class ParameterSet:
     """
@@ -24,8 +91,10 @@ class ParameterSet:
       - Inertance: mmHg*s^2/mL
 
     Notes:
-      - Provisional rule (per project decision): Rcap = Rart => Rtot = 2*Rart.
-        This is encoded via the derived property `Rtot`.
+      - Total peripheral resistance is Rtot = Rart + Rcap (Eq.57). It is
+        derived once at construction and stored as the field `Rtot`.
+      - Instances are immutable and hashable, so functions of a ParameterSet
+        can be memoized with functools.lru_cache.
     """
 
     # --- Cardiac cycle timing ---
@@ -53,21 +122,23 @@ class ParameterSet:
     Vr: float  # residual ventricular volume [mL]
 
     # --- Numerical / smoothing hyperparameters ---
-    k_valve: float = 50.0  # slope for smooth Heaviside approximation (tanh)
+    k_valve: float = 50.0  # slope for smooth Heaviside approximation
+    valve_gate: str = "tanh"  # Heaviside shape, one of physiology.valves.VALVE_GATES
 
     # --- Optional metadata ---
-    label: str = "healthy"
-    meta: Mapping[str, Any] = field(default_factory=dict)
+    # label/meta take part in equality but not in the hash, which only covers
+    # the model inputs (numeric fields and valve_gate). meta is copied into a
+    # read-only mapping so a cached ParameterSet cannot be mutated in place.
+    label: str = field(default="healthy", hash=False)
+    meta: Mapping[str, Any] = field(default_factory=dict, hash=False)
 
-    @property
-    def Rtot(self) -> float:
-        """
-        Total peripheral resistance used in Eq.57.
+    # --- Derived (not an __init__ argument) ---
+    Rtot: float = field(init=False, hash=False)  # total peripheral resistance Rart + Rcap [mmHg*s/mL]
 
-        Provisional assumption:
-          Rcap = Rart  =>  Rtot = Rcap + Rart = 2 * Rart
-        """
-        return 2.0 * self.Rart
+    def __post_init__(self) -> None:
+        # Frozen dataclass: derived fields must be set through object.__setattr__.
+        object.__setattr__(self, "meta", _FrozenMeta(self.meta))
+        object.__setattr__(self, "Rtot", float(self.Rart) + float(self.Rcap))
 
 
 @dataclass(frozen=True)
@@ -82,7 +153,11 @@ class SimulationConfig:
     n_cycles: int = 10
     points_per_cycle: int = 800
 
-    # solver selection (to be used later in integrate.py)
+    # solver selection: any solve_ivp method, or "numba_dopri5" for the
+    # compiled Dormand–Prince integrator (see simulation.integrate).
+    # "LSODA" switches to BDF around the stiff valve transitions and gets the
+    # analytical Jacobian, so it needs far fewer evaluations than RK45 (the
+    # scripts opt into it).
     method: str = "RK45"
 
     # tolerances (used later when solve_ivp is implemented)
@@ -93,6 +168,16 @@ class SimulationConfig:
     enable_steady_state_check: bool = True
     steady_state_tol: float = 1e-3  # tolerance on cycle-to-cycle difference
 
+    # if set, only the last `dense_last_n_cycles` cycles are sampled on the
+    # points_per_cycle grid; the earlier cycles are integrated without output
+    # (e.g. 2 when only last-cycle metrics/plots are needed). None keeps the
+    # whole run.
+    dense_last_n_cycles: Optional[int] = None
+
+    # storage precision of reconstructed signals (the solver state stays float64);
+    # float32 is ample for metrics/plots at these tolerances and halves memory traffic
+    signal_dtype: DTypeLike = np.float32
+
 
 @dataclass(frozen=True)
 class SimulationResult:
@@ -106,7 +191,10 @@ class SimulationResult:
       - config: SimulationConfig used
 
     Optional derived signals:
-      - signals: dict for reconstructed variables (e.g., Vlv, P0, P1, Clv, dClv_dt)
+      - states: dict of contiguous 1D copies of the columns of x (pLV, Q2, p1),
+        so per-state reductions read unit-stride memory
+      - signals: mapping for reconstructed variables (e.g., Vlv, P0, P1, Clv,
+        dClv_dt); run_simulation stores a SignalTable (one contiguous buffer)
       - metrics: dict for summary metrics (SBP/DBP/PP/MAP, SV, valve timing, ...)
     """
 
@@ -116,7 +204,8 @@ class SimulationResult:
     params: ParameterSet
     config: SimulationConfig
 
-    signals: Dict[str, ArrayLike] = field(default_factory=dict)
+    states: Dict[str, ArrayLike] = field(default_factory=dict)
+    signals: Mapping[str, ArrayLike] = field(default_factory=dict)
     metrics: Dict[str, float] = field(default_factory=dict)
     notes: Dict[str, Any] = field(default_factory=dict)
 
@@ -126,7 +215,12 @@ class SimulationResult:
     def get_state(self, name: str) -> ArrayLike:
         """
         Convenience accessor: result.get_state("p1") -> array.
+
+        Returns the contiguous array from `states` when available, otherwise
+        the (strided) column of x.
         """
+        if name in self.states:
+            return self.states[name]
         idx = {n: i for i, n in enumerate(self.state_names())}.get(name)
         if idx is None:
             raise KeyError(f"Unknown state '{name}'. Valid: {self.state_names()}")
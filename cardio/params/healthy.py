@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+from functools import lru_cache
+
 from cardio.params.dataclasses import ParameterSet
 
 
+@lru_cache(maxsize=8)
 def healthy_params(label: str = "healthy") -> ParameterSet:
     """
     Baseline (healthy) parameter set used for numerical simulations.
@@ -26,6 +29,8 @@ def healthy_params(label: str = "healthy") -> ParameterSet:
           Rtot =  Rart + Rcap
         
       - k_valve is a numerical hyperparameter controlling valve smoothing.
+      - The result is memoized per label; ParameterSet is frozen (meta is a
+        read-only mapping), so the shared instance cannot be modified.
     """
     return ParameterSet(
         Tcc=0.8,
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import math
+from functools import lru_cache
+
 import numpy as np
 
 
@@ -21,6 +24,9 @@ def cycle_time(t: float | np.ndarray, Tcc: float) -> float | np.ndarray:
     """
     if Tcc <= 0:
         raise ValueError("Tcc must be > 0")
+    if isinstance(t, (float, int)):
+        # scalar fast path: plain float arithmetic, no ufunc dispatch
+        return t - Tcc * math.floor(t / Tcc)
     return np.mod(t, Tcc)
 
 
@@ -55,6 +61,22 @@ def tvc_tvr(Tcc: float, Tcc_ref: float = 6.0 / 7.0) -> tuple[float, float]:
     return float(Tvc), float(Tvr)
 
 
+def _is_sorted(tau_arr: np.ndarray) -> bool:
+    """True for 1D arrays (of at least 2 samples) sorted in non-decreasing order."""
+    return tau_arr.ndim == 1 and tau_arr.size > 1 and bool(np.all(tau_arr[1:] >= tau_arr[:-1]))
+
+
+def _phase_bounds(tau_arr: np.ndarray, Tvc: float, Tvr: float) -> tuple[int, int, int]:
+    """
+    Segment boundaries (i0, i1, i2) of a sorted tau grid:
+      tau[:i0] < 0 (rest), tau[i0:i1] in [0, Tvc] (contraction),
+      tau[i1:i2] in (Tvc, Tvc + Tvr] (relaxation), tau[i2:] rest.
+    """
+    i0 = int(np.searchsorted(tau_arr, 0.0, side="left"))
+    i1, i2 = np.searchsorted(tau_arr, (Tvc, Tvc + Tvr), side="right")
+    return i0, int(i1), int(i2)
+
+
 def ecc(tau: float | np.ndarray, Tvc: float, Tvr: float, Tcc: float) -> float | np.ndarray:
     """
     Normalized activation function e_cc(tau) over one cardiac cycle.
@@ -82,20 +104,40 @@ def ecc(tau: float | np.ndarray, Tvc: float, Tvr: float, Tcc: float) -> float |
     if Tvc <= 0 or Tvr <= 0 or Tcc <= 0:
         raise ValueError("Tvc, Tvr, and Tcc must be > 0")
 
-    tau_arr = np.asarray(tau, dtype=float)
-    e = np.zeros_like(tau_arr)
+    if isinstance(tau, (int, float)):
+        if 0.0 <= tau <= Tvc:
+            return 0.5 * (1.0 - math.cos(math.pi * tau / Tvc))
+        if Tvc < tau <= Tvc + Tvr:
+            return 0.5 * (1.0 + math.cos(math.pi * (tau - Tvc) / Tvr))
+        return 0.0
 
-    # contraction
-    m1 = (tau_arr >= 0.0) & (tau_arr <= Tvc)
-    if np.any(m1):
-        e[m1] = 0.5 * (1.0 - np.cos(np.pi * tau_arr[m1] / Tvc))
+    tau_arr = np.asarray(tau, dtype=float)
 
-    # relaxation
-    m2 = (tau_arr > Tvc) & (tau_arr <= Tvc + Tvr)
-    if np.any(m2):
-        e[m2] = 0.5 * (1.0 + np.cos(np.pi * (tau_arr[m2] - Tvc) / Tvr))
+    if _is_sorted(tau_arr):
+        # Sorted grid: the phases are contiguous segments, so cos is only
+        # evaluated where the activation is non-zero (no masks, no gathers).
+        i0, i1, i2 = _phase_bounds(tau_arr, Tvc, Tvr)
+        # Every segment is written explicitly, so no zero-initialization pass.
+        e = np.empty_like(tau_arr)
+        e[:i0] = 0.0
+        e[i0:i1] = 0.5 * (1.0 - np.cos((np.pi / Tvc) * tau_arr[i0:i1]))
+        e[i1:i2] = 0.5 * (1.0 + np.cos((np.pi / Tvr) * (tau_arr[i1:i2] - Tvc)))
+        e[i2:] = 0.0
+        return e
+
+    # Branchless: both phases are evaluated on clipped arguments over the whole
+    # array and selected with np.where. Clipping at 0 makes tau < 0 give
+    # exactly 0 through the contraction branch (cos(0) = 1).
+    phase_c = (np.pi / Tvc) * np.clip(tau_arr, 0.0, Tvc)
+    phase_r = (np.pi / Tvr) * np.clip(tau_arr - Tvc, 0.0, Tvr)
+
+    # contraction | relaxation | rest
+    e = np.where(
+        tau_arr <= Tvc,
+        0.5 * (1.0 - np.cos(phase_c)),
+        np.where(tau_arr <= Tvc + Tvr, 0.5 * (1.0 + np.cos(phase_r)), 0.0),
+    )
 
-    # rest: already zero
     if np.isscalar(tau):
         return float(e.item())
     return e
@@ -125,20 +167,82 @@ def decc_dt(tau: float | np.ndarray, Tvc: float, Tvr: float, Tcc: float) -> floa
     if Tvc <= 0 or Tvr <= 0 or Tcc <= 0:
         raise ValueError("Tvc, Tvr, and Tcc must be > 0")
 
-    tau_arr = np.asarray(tau, dtype=float)
-    de = np.zeros_like(tau_arr)
+    if isinstance(tau, (int, float)):
+        if 0.0 <= tau <= Tvc:
+            return (math.pi / (2.0 * Tvc)) * math.sin(math.pi * tau / Tvc)
+        if Tvc < tau <= Tvc + Tvr:
+            return -(math.pi / (2.0 * Tvr)) * math.sin(math.pi * (tau - Tvc) / Tvr)
+        return 0.0
 
-    # contraction
-    m1 = (tau_arr >= 0.0) & (tau_arr <= Tvc)
-    if np.any(m1):
-        de[m1] = (np.pi / (2.0 * Tvc)) * np.sin(np.pi * tau_arr[m1] / Tvc)
+    tau_arr = np.asarray(tau, dtype=float)
 
-    # relaxation
-    m2 = (tau_arr > Tvc) & (tau_arr <= Tvc + Tvr)
-    if np.any(m2):
-        de[m2] = -(np.pi / (2.0 * Tvr)) * np.sin(np.pi * (tau_arr[m2] - Tvc) / Tvr)
+    if _is_sorted(tau_arr):
+        # Sorted grid: contiguous segments (see ecc).
+        i0, i1, i2 = _phase_bounds(tau_arr, Tvc, Tvr)
+        de = np.empty_like(tau_arr)
+        de[:i0] = 0.0
+        de[i0:i1] = (np.pi / (2.0 * Tvc)) * np.sin((np.pi / Tvc) * tau_arr[i0:i1])
+        de[i1:i2] = -(np.pi / (2.0 * Tvr)) * np.sin((np.pi / Tvr) * (tau_arr[i1:i2] - Tvc))
+        de[i2:] = 0.0
+        return de
+
+    # Same branchless pattern as ecc (sin(0) = 0 covers tau < 0).
+    phase_c = (np.pi / Tvc) * np.clip(tau_arr, 0.0, Tvc)
+    phase_r = (np.pi / Tvr) * np.clip(tau_arr - Tvc, 0.0, Tvr)
+
+    # contraction | relaxation | rest
+    de = np.where(
+        tau_arr <= Tvc,
+        (np.pi / (2.0 * Tvc)) * np.sin(phase_c),
+        np.where(tau_arr <= Tvc + Tvr, -(np.pi / (2.0 * Tvr)) * np.sin(phase_r), 0.0),
+    )
 
-    # rest: already zero
     if np.isscalar(tau):
         return float(de.item())
     return de
+
+
+@lru_cache(maxsize=32)
+def build_activation_lut(Tcc: float, N: int = 1024) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Tabulate (e_cc, de_cc/dt) on a uniform grid over one cycle.
+
+    The tables hold N+1 samples at tau_k = k*Tcc/N, k = 0..N (the last sample
+    closes the period), for use with `eval_activation_lut`. Results are cached
+    per (Tcc, N) and the arrays are read-only.
+
+    With N=1024 and Tcc = 0.8 s, linear interpolation reproduces e_cc to ~2e-5
+    and de_cc/dt to ~0.5% of its peak (the error concentrates at the phase
+    boundaries, where de_cc/dt has kinks). The tables are an approximation and
+    are only used when passed explicitly.
+    """
+    if Tcc <= 0:
+        raise ValueError("Tcc must be > 0")
+    if N < 2:
+        raise ValueError("N must be >= 2")
+
+    Tvc, Tvr = tvc_tvr(Tcc)
+    tau = np.linspace(0.0, Tcc, N + 1)
+    e_tab = ecc(tau, Tvc, Tvr, Tcc)
+    de_tab = decc_dt(tau, Tvc, Tvr, Tcc)
+    e_tab.flags.writeable = False
+    de_tab.flags.writeable = False
+    return e_tab, de_tab
+
+
+def eval_activation_lut(tau: float | np.ndarray, Tcc: float, table: np.ndarray) -> float | np.ndarray:
+    """
+    Linearly interpolate a table from `build_activation_lut` at cycle time tau in [0, Tcc].
+
+    Replaces the cos/sin evaluations of ecc/decc_dt by two indexed loads and
+    one multiply-add per sample.
+    """
+    N = table.shape[0] - 1
+    idx_f = np.asarray(tau, dtype=float) * (N / Tcc)
+    i = np.clip(idx_f.astype(np.intp), 0, N - 1)
+    frac = idx_f - i
+    y = table[i] + frac * (table[i + 1] - table[i])
+
+    if np.isscalar(tau):
+        return float(y)
+    return y
@@ -1,12 +1,35 @@
 from __future__ import annotations
 
+from functools import lru_cache
+from typing import Tuple
+
 import numpy as np
 
 from cardio.params.dataclasses import ParameterSet
-from cardio.physiology.activation import cycle_time, decc_dt, ecc, tvc_tvr
+from cardio.physiology.activation import cycle_time, decc_dt, ecc, eval_activation_lut, tvc_tvr
+
+
+ActivationLUT = Tuple[np.ndarray, np.ndarray]
+
 
+@lru_cache(maxsize=32)
+def _tvc_tvr_cached(Tcc: float) -> tuple[float, float]:
+    """tvc_tvr(Tcc), memoized (pure function of Tcc)."""
+    return tvc_tvr(Tcc)
 
-def clv(t: float | np.ndarray, params: ParameterSet) -> float | np.ndarray:
+
+@lru_cache(maxsize=32)
+def _ab(Cmin: float, Cmax: float) -> tuple[float, float]:
+    """Constants of Eq.59: A = 1/Cmin - 1/Cmax, B = 1/Cmax (memoized)."""
+    return (1.0 / Cmin) - (1.0 / Cmax), 1.0 / Cmax
+
+
+def clv(
+    t: float | np.ndarray,
+    params: ParameterSet,
+    lut: ActivationLUT | None = None,
+    out: np.ndarray | None = None,
+) -> float | np.ndarray:
     """
     Time-varying left ventricular compliance C_LV(t).
 
@@ -19,6 +42,12 @@ def clv(t: float | np.ndarray, params: ParameterSet) -> float | np.ndarray:
         Absolute time [s].
     params : ParameterSet
         Contains Tcc, Cmin, Cmax.
+    lut : (e_tab, de_tab), optional
+        Tables from activation.build_activation_lut(params.Tcc). When given,
+        e_cc is interpolated from the table instead of evaluated exactly.
+    out : np.ndarray, optional
+        Array-valued t only: float buffer of the same shape that receives
+        C_LV (and is returned), e.g. to reuse one buffer across calls.
 
     Returns
     -------
@@ -27,21 +56,36 @@ def clv(t: float | np.ndarray, params: ParameterSet) -> float | np.ndarray:
     """
     Tcc = params.Tcc
     tau = cycle_time(t, Tcc)
-    Tvc, Tvr = tvc_tvr(Tcc)
 
-    e = ecc(tau, Tvc, Tvr, Tcc)
+    if lut is None:
+        Tvc, Tvr = _tvc_tvr_cached(Tcc)
+        e = ecc(tau, Tvc, Tvr, Tcc)
+    else:
+        e = eval_activation_lut(tau, Tcc, lut[0])
+
+    A, B = _ab(params.Cmin, params.Cmax)
 
-    A = (1.0 / params.Cmin) - (1.0 / params.Cmax)
-    B = 1.0 / params.Cmax
+    if isinstance(e, np.ndarray) and e.ndim > 0:
+        # e is a fresh array: evaluate 1/(A*e + B) in place (or into `out`)
+        C = np.multiply(e, A, out=e if out is None else out)
+        C += B
+        return np.reciprocal(C, out=C)
 
     C = 1.0 / (A * e + B)
 
+    if isinstance(C, float):
+        return C
     if np.isscalar(t):
         return float(np.asarray(C).item())
     return np.asarray(C, dtype=float)
 
 
-def dclv_dt(t: float | np.ndarray, params: ParameterSet) -> float | np.ndarray:
+def dclv_dt(
+    t: float | np.ndarray,
+    params: ParameterSet,
+    lut: ActivationLUT | None = None,
+    out: np.ndarray | None = None,
+) -> float | np.ndarray:
     """
     Time derivative of ventricular compliance dC_LV/dt.
 
@@ -58,6 +102,10 @@ def dclv_dt(t: float | np.ndarray, params: ParameterSet) -> float | np.ndarray:
     t : float or np.ndarray
         Absolute time [s].
     params : ParameterSet
+    lut : (e_tab, de_tab), optional
+        Activation tables (see `clv`).
+    out : np.ndarray, optional
+        Output buffer for array-valued t (see `clv`).
 
     Returns
     -------
@@ -66,27 +114,98 @@ def dclv_dt(t: float | np.ndarray, params: ParameterSet) -> float | np.ndarray:
     """
     Tcc = params.Tcc
     tau = cycle_time(t, Tcc)
-    Tvc, Tvr = tvc_tvr(Tcc)
 
-    e = ecc(tau, Tvc, Tvr, Tcc)
-    de = decc_dt(tau, Tvc, Tvr, Tcc)
-
-    A = (1.0 / params.Cmin) - (1.0 / params.Cmax)
-    B = 1.0 / params.Cmax
+    if lut is None:
+        Tvc, Tvr = _tvc_tvr_cached(Tcc)
+        e = ecc(tau, Tvc, Tvr, Tcc)
+        de = decc_dt(tau, Tvc, Tvr, Tcc)
+    else:
+        e = eval_activation_lut(tau, Tcc, lut[0])
+        de = eval_activation_lut(tau, Tcc, lut[1])
+
+    A, B = _ab(params.Cmin, params.Cmax)
+
+    if isinstance(e, np.ndarray) and e.ndim > 0:
+        # In place on the fresh e/de arrays: no temporaries
+        denom = np.multiply(e, A, out=e)
+        denom += B
+        np.square(denom, out=denom)
+        dC = np.multiply(de, -A, out=de if out is None else out)
+        dC /= denom
+        return dC
 
     denom = (A * e + B)
     dC = -(A * de) / (denom ** 2)
 
+    if isinstance(dC, float):
+        return dC
     if np.isscalar(t):
         return float(np.asarray(dC).item())
     return np.asarray(dC, dtype=float)
 
 
-def elv(t: float | np.ndarray, params: ParameterSet) -> float | np.ndarray:
+def clv_and_dclv(
+    t: float | np.ndarray,
+    params: ParameterSet,
+    lut: ActivationLUT | None = None,
+) -> tuple[float | np.ndarray, float | np.ndarray]:
+    """
+    Fused evaluation of (C_LV(t), dC_LV/dt).
+
+    Same results as (clv(t, params), dclv_dt(t, params)) but the cycle time,
+    activation and denominator A*e + B are computed once:
+      C  = 1 / (A*e + B)
+      dC = -A * (de/dt) * C^2
+
+    Parameters
+    ----------
+    t : float or np.ndarray
+        Absolute time [s].
+    params : ParameterSet
+    lut : (e_tab, de_tab), optional
+        Activation tables (see `clv`).
+
+    Returns
+    -------
+    (C, dC) : floats or np.ndarrays
+        Compliance [mL/mmHg] and its time derivative [mL/(mmHg*s)].
+    """
+    Tcc = params.Tcc
+    tau = cycle_time(t, Tcc)
+
+    if lut is None:
+        Tvc, Tvr = _tvc_tvr_cached(Tcc)
+        e = ecc(tau, Tvc, Tvr, Tcc)
+        de = decc_dt(tau, Tvc, Tvr, Tcc)
+    else:
+        e = eval_activation_lut(tau, Tcc, lut[0])
+        de = eval_activation_lut(tau, Tcc, lut[1])
+
+    A, B = _ab(params.Cmin, params.Cmax)
+
+    C = 1.0 / (A * e + B)
+    dC = -(A * de) * (C * C)
+
+    if np.isscalar(t):
+        return float(C), float(dC)
+    return np.asarray(C, dtype=float), np.asarray(dC, dtype=float)
+
+
+def elv(
+    t: float | np.ndarray,
+    params: ParameterSet,
+    out: np.ndarray | None = None,
+) -> float | np.ndarray:
     """
     Ventricular elastance E_LV(t) = 1 / C_LV(t).
+
+    `out` is an optional output buffer for array-valued t (see `clv`).
     """
-    C = clv(t, params)
+    C = clv(t, params, out=out)
+    if isinstance(C, np.ndarray) and C.ndim > 0:
+        return np.reciprocal(C, out=C)
+    if isinstance(C, float):
+        return 1.0 / C
     E = 1.0 / np.asarray(C, dtype=float)
     if np.isscalar(t):
         return float(E.item())
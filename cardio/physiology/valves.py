@@ -1,8 +1,31 @@
 from __future__ import annotations
 
+import math
+
 import numpy as np
 
 
+# Array kernels of the gates below: x must already be float64 and k > 0
+# (the public functions validate and convert once, then call these).
+
+def _tanh_gate(x: np.ndarray, k: float) -> np.ndarray:
+    return 0.5 * (1.0 + np.tanh(k * x))
+
+
+def _algebraic_gate(x: np.ndarray, k: float) -> np.ndarray:
+    z = k * x
+    return 0.5 * (1.0 + z / np.sqrt(1.0 + z * z))
+
+
+def _rational_gate(x: np.ndarray, k: float) -> np.ndarray:
+    z = k * x
+    return 0.5 * (1.0 + z / (1.0 + np.abs(z)))
+
+
+def _hard_gate(x: np.ndarray, k: float) -> np.ndarray:
+    return (x > 0.0).astype(float)
+
+
 def heaviside_smooth(x: float | np.ndarray, k: float) -> float | np.ndarray:
     """
     Smooth approximation of the Heaviside step function using tanh:
@@ -24,19 +47,145 @@ def heaviside_smooth(x: float | np.ndarray, k: float) -> float | np.ndarray:
     if k <= 0:
         raise ValueError("k must be > 0")
 
-    x_arr = np.asarray(x, dtype=float)
-    H = 0.5 * (1.0 + np.tanh(k * x_arr))
+    if isinstance(x, (int, float)):
+        return 0.5 * (1.0 + math.tanh(k * x))
+
+    H = _tanh_gate(np.asarray(x, dtype=float), k)
 
     if np.isscalar(x):
         return float(H.item())
     return H
 
 
+def heaviside_algebraic(x: float | np.ndarray, k: float) -> float | np.ndarray:
+    """
+    Smooth approximation of the Heaviside step function without transcendentals:
+
+        H(x) ≈ (1 + k x / sqrt(1 + (k x)^2)) / 2
+
+    Same value and slope as heaviside_smooth at x = 0 (H = 1/2, dH/dx = k/2),
+    so k keeps its meaning; only the saturation tails differ (algebraic
+    instead of exponential), which is negligible for physiological pressure
+    gaps at the default k.
+
+    Parameters
+    ----------
+    x : float or np.ndarray
+        Input value(s).
+    k : float
+        Slope parameter. Larger k makes the transition sharper.
+
+    Returns
+    -------
+    H : float or np.ndarray
+        Smooth step in [0, 1].
+    """
+    if k <= 0:
+        raise ValueError("k must be > 0")
+
+    if isinstance(x, (int, float)):
+        z = k * x
+        return 0.5 * (1.0 + z / math.sqrt(1.0 + z * z))
+
+    H = _algebraic_gate(np.asarray(x, dtype=float), k)
+
+    if np.isscalar(x):
+        return float(H.item())
+    return H
+
+
+def heaviside_rational(x: float | np.ndarray, k: float) -> float | np.ndarray:
+    """
+    Rational approximation of the Heaviside step function:
+
+        H(x) ≈ (1 + k x / (1 + |k x|)) / 2
+
+    Same value and slope at x = 0 as heaviside_smooth, with only an abs and a
+    division per sample. The tails saturate slowly (1 - H ~ 1/(2 k |x|)), so
+    valve flows keep a small leak/deficit for pressure gaps of a few mmHg.
+
+    Parameters
+    ----------
+    x : float or np.ndarray
+        Input value(s).
+    k : float
+        Slope parameter. Larger k makes the transition sharper.
+
+    Returns
+    -------
+    H : float or np.ndarray
+        Smooth step in [0, 1].
+    """
+    if k <= 0:
+        raise ValueError("k must be > 0")
+
+    if isinstance(x, (int, float)):
+        z = k * x
+        return 0.5 * (1.0 + z / (1.0 + abs(z)))
+
+    H = _rational_gate(np.asarray(x, dtype=float), k)
+
+    if np.isscalar(x):
+        return float(H.item())
+    return H
+
+
+def heaviside_hard(x: float | np.ndarray, k: float) -> float | np.ndarray:
+    """
+    Exact (unsmoothed) Heaviside step, H(x) = 1 if x > 0 else 0.
+
+    With this gate the valve flows become ideal diodes, max(dp, 0)/R. k is
+    validated but otherwise unused. The right-hand side then has a kink at
+    valve opening/closing, which adaptive explicit solvers handle by
+    shortening steps; smooth gates are preferable for implicit solvers.
+
+    Parameters
+    ----------
+    x : float or np.ndarray
+        Input value(s).
+    k : float
+        Slope parameter (unused, kept for a uniform gate signature).
+
+    Returns
+    -------
+    H : float or np.ndarray
+        Step in {0, 1}.
+    """
+    if k <= 0:
+        raise ValueError("k must be > 0")
+
+    if isinstance(x, (int, float)):
+        return 1.0 if x > 0 else 0.0
+
+    H = _hard_gate(np.asarray(x, dtype=float), k)
+
+    if np.isscalar(x):
+        return float(H.item())
+    return H
+
+
+# Available Heaviside shapes, selected by ParameterSet.valve_gate.
+# The position in this tuple is the integer code used by compiled kernels.
+VALVE_GATES = ("tanh", "algebraic", "rational", "hard")
+
+_GATE_FUNCS = (heaviside_smooth, heaviside_algebraic, heaviside_rational, heaviside_hard)
+_GATE_ARRAY_FUNCS = (_tanh_gate, _algebraic_gate, _rational_gate, _hard_gate)
+
+
+def valve_gate_code(gate: str) -> int:
+    """Return the integer code of a valve gate name (see VALVE_GATES)."""
+    try:
+        return VALVE_GATES.index(gate)
+    except ValueError:
+        raise ValueError(f"Unknown valve gate '{gate}'. Valid: {VALVE_GATES}") from None
+
+
 def mitral_flow(
     pLA: float | np.ndarray,
     pLV: float | np.ndarray,
     RMV: float,
     k: float,
+    gate: str = "tanh",
 ) -> float | np.ndarray:
     """
     Mitral valve inflow P0(t):
@@ -51,6 +200,9 @@ def mitral_flow(
         Mitral valve resistance [mmHg*s/mL].
     k : float
         Smoothing parameter for the Heaviside approximation.
+    gate : str
+        Heaviside shape, one of VALVE_GATES (default "tanh"; "hard" gives
+        the ideal diode max(dp, 0)/R).
 
     Returns
     -------
@@ -60,9 +212,16 @@ def mitral_flow(
     if RMV <= 0:
         raise ValueError("RMV must be > 0")
 
-    dp = np.asarray(pLA, dtype=float) - np.asarray(pLV, dtype=float)
-    H = heaviside_smooth(dp, k=k)
-    P0 = (dp / RMV) * H
+    code = valve_gate_code(gate)
+    if isinstance(pLA, (int, float)) and isinstance(pLV, (int, float)):
+        dp = float(pLA) - float(pLV)
+        return (dp / RMV) * _GATE_FUNCS[code](dp, k=k)
+
+    # dp is float64 from here on, so the gate kernel skips re-validation
+    if k <= 0:
+        raise ValueError("k must be > 0")
+    dp = np.subtract(pLA, pLV, dtype=float)
+    P0 = (dp / RMV) * _GATE_ARRAY_FUNCS[code](dp, k)
 
     # Preserve scalar if all inputs are scalar
     if np.isscalar(pLA) and np.isscalar(pLV):
@@ -75,6 +234,7 @@ def aortic_flow(
     p1: float | np.ndarray,
     RAV: float,
     k: float,
+    gate: str = "tanh",
 ) -> float | np.ndarray:
     """
     Aortic valve outflow P1(t):
@@ -89,6 +249,9 @@ def aortic_flow(
         Aortic valve resistance [mmHg*s/mL].
     k : float
         Smoothing parameter for the Heaviside approximation.
+    gate : str
+        Heaviside shape, one of VALVE_GATES (default "tanh"; "hard" gives
+        the ideal diode max(dp, 0)/R).
 
     Returns
     -------
@@ -98,9 +261,15 @@ def aortic_flow(
     if RAV <= 0:
         raise ValueError("RAV must be > 0")
 
-    dp = np.asarray(pLV, dtype=float) - np.asarray(p1, dtype=float)
-    H = heaviside_smooth(dp, k=k)
-    P1 = (dp / RAV) * H
+    code = valve_gate_code(gate)
+    if isinstance(pLV, (int, float)) and isinstance(p1, (int, float)):
+        dp = float(pLV) - float(p1)
+        return (dp / RAV) * _GATE_FUNCS[code](dp, k=k)
+
+    if k <= 0:
+        raise ValueError("k must be > 0")
+    dp = np.subtract(pLV, p1, dtype=float)
+    P1 = (dp / RAV) * _GATE_ARRAY_FUNCS[code](dp, k)
 
     if np.isscalar(pLV) and np.isscalar(p1):
         return float(np.asarray(P1).item())
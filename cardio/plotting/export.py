@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import matplotlib.pyplot as plt
+
+
+def export_pdf_enabled() -> bool:
+    """True when $CARDIO_EXPORT_PDF is set to anything but "" or "0"."""
+    return os.environ.get("CARDIO_EXPORT_PDF", "") not in ("", "0")
+
+
+def save_figure(fig: plt.Figure, outdir: Path, name: str, dpi: int = 300) -> None:
+    """
+    Save `fig` as outdir/<name>.png, plus outdir/<name>.pdf if export_pdf_enabled().
+
+    Both files are cropped to the tight bounding box. PNG only: bbox_inches="tight"
+    (one measuring pass). PNG + PDF: the bbox is measured once, at the PNG dpi
+    so text extents match, and passed explicitly to both saves, instead of
+    each savefig measuring it again.
+    """
+    out_png = Path(outdir) / f"{name}.png"
+
+    # Sequential on purpose: both saves draw the same Figure, and matplotlib
+    # artists are not thread-safe.
+    if not export_pdf_enabled():
+        fig.savefig(out_png, dpi=dpi, bbox_inches="tight")
+        return
+
+    screen_dpi = fig.dpi
+    fig.set_dpi(dpi)
+    fig.canvas.draw()
+    bbox = fig.get_tightbbox(fig.canvas.get_renderer()).padded(plt.rcParams["savefig.pad_inches"])
+    fig.set_dpi(screen_dpi)
+    fig.savefig(out_png, dpi=dpi, bbox_inches=bbox)
+    fig.savefig(Path(outdir) / f"{name}.pdf", bbox_inches=bbox, format="pdf")
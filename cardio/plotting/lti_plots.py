@@ -1,10 +1,84 @@
 from __future__ import annotations
 
-from typing import Iterable, Optional, Tuple
+from functools import lru_cache
+from typing import Dict, Iterable, Optional, Tuple
 
 import numpy as np
 import matplotlib.pyplot as plt
-from scipy import signal
+from scipy import linalg, signal
+
+
+_MatrixKey = Tuple[Tuple[int, ...], bytes]
+
+
+def _matrix_key(M: np.ndarray) -> _MatrixKey:
+    M = np.ascontiguousarray(M, dtype=float)
+    return M.shape, M.tobytes()
+
+
+def _from_key(key: _MatrixKey) -> np.ndarray:
+    shape, buf = key
+    return np.frombuffer(buf, dtype=float).reshape(shape)
+
+
+@lru_cache(maxsize=64)
+def _cached_ss(num: Tuple[float, ...], den: Tuple[float, ...]) -> Tuple[np.ndarray, ...]:
+    """State-space matrices (A, B, C, D) of num/den, converted once per transfer function."""
+    return tuple(np.asarray(m, dtype=float) for m in signal.tf2ss(num, den))
+
+
+def _ss_matrices(sys: signal.lti) -> Tuple[np.ndarray, ...]:
+    if isinstance(sys, signal.StateSpace):
+        return sys.A, sys.B, sys.C, sys.D
+    tf = sys if isinstance(sys, signal.TransferFunction) else sys.to_tf()
+    return _cached_ss(tuple(np.ravel(tf.num)), tuple(np.ravel(tf.den)))
+
+
+@lru_cache(maxsize=32)
+def _impulse_step_cached(
+    A_key: _MatrixKey, B_key: _MatrixKey, C_key: _MatrixKey, D_key: _MatrixKey, t_end: float, n: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    A, B, C, D = (_from_key(k) for k in (A_key, B_key, C_key, D_key))
+    nx = A.shape[0]
+    t = np.linspace(0.0, t_end, n)
+    dt = t[1] - t[0]
+
+    # One exact (zero-order hold) discretization shared by both responses:
+    # expm([[A, B], [0, 0]] * dt) = [[Ad, Bd], [0, I]]
+    M = np.zeros((nx + 1, nx + 1))
+    M[:nx, :nx] = A * dt
+    M[:nx, nx:] = B[:, :1] * dt
+    E = linalg.expm(M)
+    Ad, Bd = E[:nx, :nx], E[:nx, nx]
+
+    # Column 0: impulse (x0 = B, u = 0); column 1: unit step (x0 = 0, u = 1)
+    X = np.empty((n, nx, 2))
+    X[0, :, 0] = B[:, 0]
+    X[0, :, 1] = 0.0
+    for i in range(1, n):
+        X[i] = Ad @ X[i - 1]
+        X[i, :, 1] += Bd
+
+    Y = np.einsum("j,njk->nk", C[0], X)
+    y_imp = Y[:, 0]
+    y_step = Y[:, 1] + D[0, 0]
+    for arr in (t, y_imp, y_step):
+        arr.flags.writeable = False
+    return t, y_imp, y_step
+
+
+def _impulse_and_step(sys: signal.lti, t_end: float, n: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    (t, impulse, step) responses of a SISO system on linspace(0, t_end, n).
+
+    Same conventions as scipy.signal.impulse/step (zero initial state; the
+    impulse ignores the feedthrough D). Both responses are computed from a
+    single matrix exponential and cached, so plotting the impulse and the
+    step response of the same system solves it once.
+    """
+    A, B, C, D = _ss_matrices(sys)
+    keys = tuple(_matrix_key(m) for m in (A, B, C, D))
+    return _impulse_step_cached(*keys, float(t_end), int(n))
 
 
 def plot_pole_zero_map(
@@ -48,15 +122,19 @@ def plot_impulse_response(
     n: int = 2000,
     title: str = "Impulse response (Δp1 from ΔQin)",
     ax: Optional[plt.Axes] = None,
+    sys_ss: Optional[signal.StateSpace] = None,
 ) -> plt.Axes:
     """
     Impulse response y(t) for the transfer function sys_tf.
+
+    Computed on the state-space form together with the step response (see
+    _impulse_and_step); pass sys_ss (= sys_tf.to_ss()) to skip the conversion.
     """
     if ax is None:
         _, ax = plt.subplots()
 
-    t = np.linspace(0.0, float(t_end), int(n))
-    tout, y = signal.impulse(sys_tf, T=t)
+    responses = _impulse_and_step(sys_ss if sys_ss is not None else sys_tf, t_end, n)
+    tout, y = responses[0], responses[1]
 
     ax.plot(tout, y)
     ax.set_title(title)
@@ -72,15 +150,19 @@ def plot_step_response(
     n: int = 2000,
     title: str = "Step response (Δp1 from ΔQin)",
     ax: Optional[plt.Axes] = None,
+    sys_ss: Optional[signal.StateSpace] = None,
 ) -> plt.Axes:
     """
     Step response y(t) for the transfer function sys_tf.
+
+    Computed on the state-space form together with the impulse response (see
+    _impulse_and_step); pass sys_ss (= sys_tf.to_ss()) to skip the conversion.
     """
     if ax is None:
         _, ax = plt.subplots()
 
-    t = np.linspace(0.0, float(t_end), int(n))
-    tout, y = signal.step(sys_tf, T=t)
+    responses = _impulse_and_step(sys_ss if sys_ss is not None else sys_tf, t_end, n)
+    tout, y = responses[0], responses[2]
 
     ax.plot(tout, y)
     ax.set_title(title)
@@ -104,26 +186,33 @@ def plot_bode(
     """
     Bode magnitude + phase for sys_tf using scipy.signal.freqresp.
 
-    w: rad/s frequency grid. If None, logspace(w_min, w_max, n).
+    w: rad/s frequency grid. If None, geomspace(w_min, w_max, n).
+
+    The transfer function is evaluated directly (freqresp converts
+    state-space input to zeros/poles on every call, so sys_tf is kept as is).
     """
     if w is None:
-        w = np.logspace(np.log10(float(w_min)), np.log10(float(w_max)), int(n))
+        w = np.geomspace(float(w_min), float(w_max), int(n))
 
     w = np.asarray(w, dtype=float)
     _, H = signal.freqresp(sys_tf, w=w)
-    mag = np.abs(H)
-    phase = np.angle(H, deg=True)
+
+    # One complex log gives both parts: log H = ln|H| + i*arg(H)
+    with np.errstate(divide="ignore"):
+        log_H = np.log(H)
+    phase = np.degrees(log_H.imag)
 
     if ax_mag is None or ax_phase is None:
         fig, (ax_mag, ax_phase) = plt.subplots(2, 1, sharex=True)
         fig.suptitle(title)
 
     if magnitude_db:
-        mag_plot = 20.0 * np.log10(np.maximum(mag, 1e-30))
+        # 20*log10(max(|H|, 1e-30)) == (20/ln 10) * max(ln|H|, ln 1e-30)
+        mag_plot = (20.0 / np.log(10.0)) * np.maximum(log_H.real, np.log(1e-30))
         ax_mag.semilogx(w, mag_plot)
         ax_mag.set_ylabel("Magnitude (dB)")
     else:
-        ax_mag.semilogx(w, mag)
+        ax_mag.semilogx(w, np.abs(H))
         ax_mag.set_ylabel("Magnitude")
 
     ax_phase.semilogx(w, phase)
@@ -142,15 +231,48 @@ def plot_lti_summary(
     sys_tf: signal.TransferFunction,
     title_prefix: str = "Arterial Windkessel (LTI)",
     t_end: float = 5.0,
-) -> None:
+    sys_ss: Optional[signal.StateSpace] = None,
+    axes: Optional[Dict[str, plt.Axes]] = None,
+) -> Dict[str, plt.Axes]:
     """
     Convenience function to generate the standard set of LTI plots:
     - pole-zero map
     - impulse response
     - step response
     - bode plot
+
+    sys_ss: state-space form of sys_tf (e.g. ArterialLTI.sys_ss). If None it
+    is converted once here and shared by the impulse and step plots.
+
+    axes: optional dict with keys "pz", "impulse", "step", "bode_mag" and
+    "bode_phase" to draw into (e.g. to reuse a figure across a sweep). If
+    None, a single 2x2 figure is created, with the Bode magnitude/phase
+    stacked in the bottom-right cell.
+
+    Returns the axes dict.
     """
-    plot_pole_zero_map(poles, zeros, title=f"{title_prefix} — Pole-zero map")
-    plot_impulse_response(sys_tf, t_end=t_end, title=f"{title_prefix} — Impulse response")
-    plot_step_response(sys_tf, t_end=t_end, title=f"{title_prefix} — Step response")
-    plot_bode(sys_tf, title=f"{title_prefix} — Bode plot")
+    if sys_ss is None:
+        sys_ss = sys_tf.to_ss()
+
+    if axes is None:
+        fig = plt.figure(figsize=(10, 8), layout="constrained")
+        fig.suptitle(title_prefix)
+        gs = fig.add_gridspec(2, 2)
+        gs_bode = gs[1, 1].subgridspec(2, 1, hspace=0.05)
+        ax_mag = fig.add_subplot(gs_bode[0])
+        axes = {
+            "pz": fig.add_subplot(gs[0, 0]),
+            "impulse": fig.add_subplot(gs[0, 1]),
+            "step": fig.add_subplot(gs[1, 0]),
+            "bode_mag": ax_mag,
+            "bode_phase": fig.add_subplot(gs_bode[1], sharex=ax_mag),
+        }
+
+    plot_pole_zero_map(poles, zeros, title="Pole-zero map", ax=axes["pz"])
+    plot_impulse_response(sys_tf, t_end=t_end, title="Impulse response", ax=axes["impulse"], sys_ss=sys_ss)
+    plot_step_response(sys_tf, t_end=t_end, title="Step response", ax=axes["step"], sys_ss=sys_ss)
+    plot_bode(sys_tf, ax_mag=axes["bode_mag"], ax_phase=axes["bode_phase"])
+    axes["bode_mag"].set_title("Bode plot")
+    axes["bode_mag"].tick_params(labelbottom=False)
+
+    return axes
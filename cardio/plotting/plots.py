@@ -8,16 +8,17 @@ import matplotlib.pyplot as plt
 from cardio.params.dataclasses import SimulationResult
 
 
-def _last_cycle_slice(res: SimulationResult) -> Tuple[np.ndarray, np.ndarray]:
+def _last_cycle_slice(res: SimulationResult) -> Tuple[np.ndarray, slice]:
     """
-    Return (t, idx_mask) for the last cardiac cycle in a SimulationResult.
+    Return (t, sl) for the last cardiac cycle in a SimulationResult.
+
+    t is sorted, so the first sample with t >= t_end - Tcc is found by binary
+    search; indexing signals with the returned slice gives views (no copies).
     """
     t = np.asarray(res.t, dtype=float).reshape(-1)
     Tcc = float(res.params.Tcc)
-    t_end = t[-1]
-    start = t_end - Tcc
-    mask = t >= start
-    return t, mask
+    start = int(np.searchsorted(t, t[-1] - Tcc, side="left"))
+    return t, slice(start, None)
 
 
 def plot_clv(res: SimulationResult, show_last_cycle: bool = False, ax=None):
@@ -34,8 +35,8 @@ def plot_clv(res: SimulationResult, show_last_cycle: bool = False, ax=None):
         fig, ax = plt.subplots()
 
     if show_last_cycle:
-        _, mask = _last_cycle_slice(res)
-        ax.plot(t[mask], clv[mask], label=f"{res.params.label} (last cycle)")
+        _, sl = _last_cycle_slice(res)
+        ax.plot(t[sl], clv[sl], label=f"{res.params.label} (last cycle)")
         ax.set_xlabel("Time [s] (last cycle)")
     else:
         ax.plot(t, clv, label=res.params.label)
@@ -64,8 +65,8 @@ def plot_p1(
         fig, ax = plt.subplots()
 
     if last_cycle:
-        t_h, m_h = _last_cycle_slice(healthy)
-        ax.plot(t_h[m_h], healthy.signals["p1"][m_h], label=f"{healthy.params.label}")
+        t_h, sl_h = _last_cycle_slice(healthy)
+        ax.plot(t_h[sl_h], healthy.signals["p1"][sl_h], label=f"{healthy.params.label}")
         ax.set_xlabel("Time [s] (last cycle)")
     else:
         ax.plot(healthy.t, healthy.signals["p1"], label=f"{healthy.params.label}")
@@ -75,8 +76,8 @@ def plot_p1(
         if "p1" not in pathology.signals:
             raise KeyError("Signal 'p1' not found in pathology.signals")
         if last_cycle:
-            t_p, m_p = _last_cycle_slice(pathology)
-            ax.plot(t_p[m_p], pathology.signals["p1"][m_p], label=f"{pathology.params.label}")
+            t_p, sl_p = _last_cycle_slice(pathology)
+            ax.plot(t_p[sl_p], pathology.signals["p1"][sl_p], label=f"{pathology.params.label}")
         else:
             ax.plot(pathology.t, pathology.signals["p1"], label=f"{pathology.params.label}")
 
@@ -104,10 +105,10 @@ def plot_pv_loop(
         fig, ax = plt.subplots()
 
     if last_cycle:
-        _, m_h = _last_cycle_slice(healthy)
+        _, sl_h = _last_cycle_slice(healthy)
         ax.plot(
-            healthy.signals["Vlv"][m_h],
-            healthy.signals["pLV"][m_h],
+            healthy.signals["Vlv"][sl_h],
+            healthy.signals["pLV"][sl_h],
             label=f"{healthy.params.label}",
         )
     else:
@@ -118,10 +119,10 @@ def plot_pv_loop(
             if key not in pathology.signals:
                 raise KeyError(f"Signal '{key}' not found in pathology.signals")
         if last_cycle:
-            _, m_p = _last_cycle_slice(pathology)
+            _, sl_p = _last_cycle_slice(pathology)
             ax.plot(
-                pathology.signals["Vlv"][m_p],
-                pathology.signals["pLV"][m_p],
+                pathology.signals["Vlv"][sl_p],
+                pathology.signals["pLV"][sl_p],
                 label=f"{pathology.params.label}",
             )
         else:
@@ -152,9 +153,9 @@ def plot_valve_flows(
         fig, ax = plt.subplots()
 
     if last_cycle:
-        t_h, m_h = _last_cycle_slice(healthy)
-        ax.plot(t_h[m_h], healthy.signals["P0"][m_h], label=f"MV P0 — {healthy.params.label}")
-        ax.plot(t_h[m_h], healthy.signals["P1"][m_h], label=f"AV P1 — {healthy.params.label}")
+        t_h, sl_h = _last_cycle_slice(healthy)
+        ax.plot(t_h[sl_h], healthy.signals["P0"][sl_h], label=f"MV P0 — {healthy.params.label}")
+        ax.plot(t_h[sl_h], healthy.signals["P1"][sl_h], label=f"AV P1 — {healthy.params.label}")
         ax.set_xlabel("Time [s] (last cycle)")
     else:
         ax.plot(healthy.t, healthy.signals["P0"], label=f"MV P0 — {healthy.params.label}")
@@ -166,9 +167,9 @@ def plot_valve_flows(
             if key not in pathology.signals:
                 raise KeyError(f"Signal '{key}' not found in pathology.signals")
         if last_cycle:
-            t_p, m_p = _last_cycle_slice(pathology)
-            ax.plot(t_p[m_p], pathology.signals["P0"][m_p], label=f"MV P0 — {pathology.params.label}")
-            ax.plot(t_p[m_p], pathology.signals["P1"][m_p], label=f"AV P1 — {pathology.params.label}")
+            t_p, sl_p = _last_cycle_slice(pathology)
+            ax.plot(t_p[sl_p], pathology.signals["P0"][sl_p], label=f"MV P0 — {pathology.params.label}")
+            ax.plot(t_p[sl_p], pathology.signals["P1"][sl_p], label=f"AV P1 — {pathology.params.label}")
         else:
             ax.plot(pathology.t, pathology.signals["P0"], label=f"MV P0 — {pathology.params.label}")
             ax.plot(pathology.t, pathology.signals["P1"], label=f"AV P1 — {pathology.params.label}")
@@ -196,8 +197,8 @@ def plot_q2(
         fig, ax = plt.subplots()
 
     if last_cycle:
-        t_h, m_h = _last_cycle_slice(healthy)
-        ax.plot(t_h[m_h], healthy.signals["Q2"][m_h], label=f"{healthy.params.label}")
+        t_h, sl_h = _last_cycle_slice(healthy)
+        ax.plot(t_h[sl_h], healthy.signals["Q2"][sl_h], label=f"{healthy.params.label}")
         ax.set_xlabel("Time [s] (last cycle)")
     else:
         ax.plot(healthy.t, healthy.signals["Q2"], label=f"{healthy.params.label}")
@@ -207,8 +208,8 @@ def plot_q2(
         if "Q2" not in pathology.signals:
             raise KeyError("Signal 'Q2' not found in pathology.signals")
         if last_cycle:
-            t_p, m_p = _last_cycle_slice(pathology)
-            ax.plot(t_p[m_p], pathology.signals["Q2"][m_p], label=f"{pathology.params.label}")
+            t_p, sl_p = _last_cycle_slice(pathology)
+            ax.plot(t_p[sl_p], pathology.signals["Q2"][sl_p], label=f"{pathology.params.label}")
         else:
             ax.plot(pathology.t, pathology.signals["Q2"], label=f"{pathology.params.label}")
 
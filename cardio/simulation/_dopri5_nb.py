@@ -0,0 +1,212 @@
+"""
+Compiled Dormand–Prince 5(4) integrator for the nonlinear systemic model.
+
+The whole time loop runs in compiled code and calls the scalar right-hand side
+kernel (cardio.models.systemic_nonlinear_nb._rhs_kernel) directly, so there is
+no Python callback per stage as with scipy.integrate.solve_ivp.
+
+Step-size control follows solve_ivp's RK45 (same error norm and controller
+constants). Steps are shortened to land exactly on each t_eval point, so the
+output is sampled without dense-output interpolation.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from cardio._numba import njit, prange
+from cardio.models.systemic_nonlinear_nb import _rhs_kernel
+
+
+# Dormand–Prince tableau (same as scipy.integrate.RK45)
+_C2, _C3, _C4, _C5 = 1.0 / 5.0, 3.0 / 10.0, 4.0 / 5.0, 8.0 / 9.0
+
+_A21 = 1.0 / 5.0
+_A31, _A32 = 3.0 / 40.0, 9.0 / 40.0
+_A41, _A42, _A43 = 44.0 / 45.0, -56.0 / 15.0, 32.0 / 9.0
+_A51, _A52, _A53, _A54 = 19372.0 / 6561.0, -25360.0 / 2187.0, 64448.0 / 6561.0, -212.0 / 729.0
+_A61, _A62, _A63, _A64, _A65 = (
+    9017.0 / 3168.0, -355.0 / 33.0, 46732.0 / 5247.0, 49.0 / 176.0, -5103.0 / 18656.0,
+)
+_B1, _B3, _B4, _B5, _B6 = 35.0 / 384.0, 500.0 / 1113.0, 125.0 / 192.0, -2187.0 / 6784.0, 11.0 / 84.0
+
+# Error weights (5th-order minus embedded 4th-order solution)
+_E1, _E3, _E4, _E5, _E6, _E7 = (
+    -71.0 / 57600.0, 71.0 / 16695.0, -71.0 / 1920.0, 17253.0 / 339200.0, -22.0 / 525.0, 1.0 / 40.0,
+)
+
+_SAFETY = 0.9
+_MIN_FACTOR = 0.2
+_MAX_FACTOR = 10.0
+_ERROR_EXPONENT = -1.0 / 5.0
+
+# Status codes returned by dopri5
+DOPRI5_SUCCESS = 0
+DOPRI5_STEP_TOO_SMALL = -1
+DOPRI5_MAX_STEPS = -2
+
+
+@njit(cache=True, fastmath=True)
+def _f(t, y, args, out):
+    Tcc, Cmax, Cmin, pLA, pRA, RMV, RAV, Cart, Iart, Rtot, k_valve, gate = args
+    _rhs_kernel(
+        t, y[0], y[1], y[2],
+        Tcc, Cmax, Cmin, pLA, pRA, RMV, RAV, Cart, Iart, Rtot, k_valve, gate,
+        out,
+    )
+
+
+@njit(cache=True, fastmath=True)
+def _initial_step(t0, y0, f0, args, rtol, atol):
+    """Initial step heuristic (Hairer, Norsett & Wanner, as in solve_ivp)."""
+    n = y0.size
+    d0 = 0.0
+    d1 = 0.0
+    for i in range(n):
+        sc = atol + rtol * abs(y0[i])
+        d0 += (y0[i] / sc) ** 2
+        d1 += (f0[i] / sc) ** 2
+    d0 = np.sqrt(d0 / n)
+    d1 = np.sqrt(d1 / n)
+    h0 = 1e-6 if (d0 < 1e-5 or d1 < 1e-5) else 0.01 * d0 / d1
+
+    y1 = np.empty(n)
+    f1 = np.empty(n)
+    for i in range(n):
+        y1[i] = y0[i] + h0 * f0[i]
+    _f(t0 + h0, y1, args, f1)
+
+    d2 = 0.0
+    for i in range(n):
+        sc = atol + rtol * abs(y0[i])
+        d2 += ((f1[i] - f0[i]) / sc) ** 2
+    d2 = np.sqrt(d2 / n) / h0
+
+    if d1 <= 1e-15 and d2 <= 1e-15:
+        h1 = max(1e-6, h0 * 1e-3)
+    else:
+        h1 = (0.01 / max(d1, d2)) ** (1.0 / 5.0)
+    return min(100.0 * h0, h1)
+
+
+@njit(cache=True, fastmath=True)
+def dopri5(t_eval, x0, args, rtol, atol, max_steps):
+    """
+    Integrate from t_eval[0] to t_eval[-1] and return (x, status).
+
+    x : (N, 3) states at t_eval (rows past a failure are left unset).
+    status : DOPRI5_SUCCESS, DOPRI5_STEP_TOO_SMALL or DOPRI5_MAX_STEPS.
+    """
+    n = x0.size
+    n_out = t_eval.size
+    x = np.empty((n_out, n))
+
+    y = x0.copy()
+    y_new = np.empty(n)
+    y_stage = np.empty(n)
+    k1 = np.empty(n)
+    k2 = np.empty(n)
+    k3 = np.empty(n)
+    k4 = np.empty(n)
+    k5 = np.empty(n)
+    k6 = np.empty(n)
+    k7 = np.empty(n)
+
+    t = t_eval[0]
+    for i in range(n):
+        x[0, i] = y[i]
+    _f(t, y, args, k1)
+
+    h = _initial_step(t, y, k1, args, rtol, atol)
+    n_steps = 0
+
+    for j in range(1, n_out):
+        t_next = t_eval[j]
+        while t < t_next:
+            if n_steps >= max_steps:
+                return x, DOPRI5_MAX_STEPS
+            h_min = 10.0 * abs(np.nextafter(t, np.inf) - t)
+            if h < h_min:
+                return x, DOPRI5_STEP_TOO_SMALL
+
+            # do not step past the next output time
+            last = t + h >= t_next
+            h_step = t_next - t if last else h
+
+            for i in range(n):
+                y_stage[i] = y[i] + h_step * _A21 * k1[i]
+            _f(t + _C2 * h_step, y_stage, args, k2)
+            for i in range(n):
+                y_stage[i] = y[i] + h_step * (_A31 * k1[i] + _A32 * k2[i])
+            _f(t + _C3 * h_step, y_stage, args, k3)
+            for i in range(n):
+                y_stage[i] = y[i] + h_step * (_A41 * k1[i] + _A42 * k2[i] + _A43 * k3[i])
+            _f(t + _C4 * h_step, y_stage, args, k4)
+            for i in range(n):
+                y_stage[i] = y[i] + h_step * (
+                    _A51 * k1[i] + _A52 * k2[i] + _A53 * k3[i] + _A54 * k4[i]
+                )
+            _f(t + _C5 * h_step, y_stage, args, k5)
+            for i in range(n):
+                y_stage[i] = y[i] + h_step * (
+                    _A61 * k1[i] + _A62 * k2[i] + _A63 * k3[i] + _A64 * k4[i] + _A65 * k5[i]
+                )
+            _f(t + h_step, y_stage, args, k6)
+            for i in range(n):
+                y_new[i] = y[i] + h_step * (
+                    _B1 * k1[i] + _B3 * k3[i] + _B4 * k4[i] + _B5 * k5[i] + _B6 * k6[i]
+                )
+            t_new = t_next if last else t + h_step
+            _f(t_new, y_new, args, k7)
+
+            err = 0.0
+            for i in range(n):
+                sc = atol + rtol * max(abs(y[i]), abs(y_new[i]))
+                e = h_step * (
+                    _E1 * k1[i] + _E3 * k3[i] + _E4 * k4[i] + _E5 * k5[i] + _E6 * k6[i] + _E7 * k7[i]
+                )
+                err += (e / sc) ** 2
+            err = np.sqrt(err / n)
+            n_steps += 1
+
+            if err < 1.0:
+                if err == 0.0:
+                    factor = _MAX_FACTOR
+                else:
+                    factor = min(_MAX_FACTOR, _SAFETY * err ** _ERROR_EXPONENT)
+                # a step shortened to hit t_next does not limit the next step
+                if not last or h_step >= h:
+                    h = h_step * factor
+                t = t_new
+                for i in range(n):
+                    y[i] = y_new[i]
+                    k1[i] = k7[i]  # FSAL
+            else:
+                h = h_step * max(_MIN_FACTOR, _SAFETY * err ** _ERROR_EXPONENT)
+
+        for i in range(n):
+            x[j, i] = y[i]
+
+    return x, DOPRI5_SUCCESS
+
+
+@njit(cache=True, parallel=True)
+def dopri5_batch(t_eval, X0, P, gates, rtol, atol, max_steps):
+    """
+    Run dopri5 for K independent systems (one per row of X0), in parallel.
+
+    (P, gates) come from rhs_args_batched. Each system keeps its own step
+    size control. Returns X (K, N, 3) and the (K,) status codes.
+    """
+    K = X0.shape[0]
+    X = np.empty((K, t_eval.size, 3))
+    status = np.empty(K, dtype=np.int64)
+    for k in prange(K):
+        args = (
+            P[k, 0], P[k, 1], P[k, 2], P[k, 3], P[k, 4], P[k, 5],
+            P[k, 6], P[k, 7], P[k, 8], P[k, 9], P[k, 10], gates[k],
+        )
+        x, st = dopri5(t_eval, X0[k].copy(), args, rtol, atol, max_steps)
+        X[k] = x
+        status[k] = st
+    return X, status
@@ -1,12 +1,54 @@
 from __future__ import annotations
 
-from typing import Tuple
+from typing import Sequence, Tuple
 
 import numpy as np
 from scipy.integrate import solve_ivp
 
-from cardio.models.systemic_nonlinear import rhs
+from cardio._numba import NUMBA_AVAILABLE, njit
+from cardio.models.systemic_nonlinear import make_jac, make_jac_batched, make_rhs, make_rhs_batched
+from cardio.models.systemic_nonlinear_nb import rhs_args, rhs_args_batched
 from cardio.params.dataclasses import ParameterSet, SimulationConfig
+from cardio.simulation._dopri5_nb import DOPRI5_MAX_STEPS, DOPRI5_SUCCESS, dopri5, dopri5_batch
+
+
+# solve_ivp methods that use a Jacobian (otherwise estimated by finite differences)
+_IMPLICIT_METHODS = ("Radau", "BDF", "LSODA")
+
+# Compiled in-house integrator (see cardio.simulation._dopri5_nb); any other
+# method name is passed to solve_ivp.
+NUMBA_DOPRI5 = "numba_dopri5"
+_DOPRI5_STEP_LIMIT = 10_000_000
+
+
+@njit(cache=True)
+def _increasing_loop(t):
+    for i in range(1, t.size):
+        if not t[i] > t[i - 1]:
+            return False
+    return True
+
+
+def _is_strictly_increasing(t: np.ndarray) -> bool:
+    """
+    True if every sample is greater than the previous one (NaN fails).
+
+    Compiled, it stops at the first offending sample without temporaries;
+    without Numba a single diff + min reduction replaces the Python loop.
+    """
+    if NUMBA_AVAILABLE:
+        return bool(_increasing_loop(t))
+    return bool(np.diff(t).min() > 0)
+
+
+def _check_t_eval(t_eval: np.ndarray) -> np.ndarray:
+    """Return t_eval as a 1D float array, checking it is a valid output grid."""
+    t_eval = np.asarray(t_eval, dtype=float).reshape(-1)
+    if t_eval.size < 2:
+        raise ValueError("t_eval must contain at least 2 time points.")
+    if not _is_strictly_increasing(t_eval):
+        raise ValueError("t_eval must be strictly increasing.")
+    return t_eval
 
 
 def integrate_system(
@@ -14,6 +56,7 @@ def integrate_system(
     config: SimulationConfig,
     x0: np.ndarray,
     t_eval: np.ndarray,
+    copy: bool = False,
 ) -> Tuple[np.ndarray, np.ndarray]:
     """
     Integrate the nonlinear ODE system over the provided time grid.
@@ -23,11 +66,16 @@ def integrate_system(
     params : ParameterSet
         Model parameters.
     config : SimulationConfig
-        Numerical configuration (solver method, tolerances).
+        Numerical configuration (solver method, tolerances). method="numba_dopri5"
+        selects the compiled Dormand–Prince integrator instead of solve_ivp.
     x0 : np.ndarray
         Initial state vector [pLV0, Q2_0, p1_0].
     t_eval : np.ndarray
         Time points where the solution is sampled (monotonic increasing).
+    copy : bool
+        If False (default), x may be a transposed view of the solver's (3, N)
+        output (column-major, so each state column is contiguous); treat it
+        as read-only. If True, x is a freshly owned C-ordered array.
 
     Returns
     -------
@@ -40,18 +88,26 @@ def integrate_system(
     if x0.size != 3:
         raise ValueError("x0 must have size 3: [pLV0, Q2_0, p1_0].")
 
-    t_eval = np.asarray(t_eval, dtype=float).reshape(-1)
-    if t_eval.size < 2:
-        raise ValueError("t_eval must contain at least 2 time points.")
-    if not np.all(np.diff(t_eval) > 0):
-        raise ValueError("t_eval must be strictly increasing.")
+    t_eval = _check_t_eval(t_eval)
+
+    if config.method == NUMBA_DOPRI5:
+        # the compiled driver already returns an owned, C-ordered x
+        return _integrate_dopri5(params, config, x0, t_eval)
 
     t0 = float(t_eval[0])
     tf = float(t_eval[-1])
 
-    # Wrapper to match solve_ivp signature
-    def f(t: float, x: np.ndarray) -> np.ndarray:
-        return rhs(t, x, params)
+    # Wrapper to match solve_ivp signature (parameters unpacked once).
+    # solve_ivp always calls fun from Python (it takes no LowLevelCallable),
+    # so the per-call cost here is dominated by scipy's own wrapping; for a
+    # fully compiled time loop use method="numba_dopri5".
+    f = make_rhs(params)
+
+    # Implicit methods get the analytical Jacobian: one evaluation per update
+    # instead of n+1 right-hand side calls for a finite-difference estimate.
+    extra = {}
+    if config.method in _IMPLICIT_METHODS:
+        extra["jac"] = make_jac(params)
 
     sol = solve_ivp(
         fun=f,
@@ -62,16 +118,118 @@ def integrate_system(
         rtol=config.rtol,
         atol=config.atol,
         vectorized=False,
+        **extra,
     )
 
     if not sol.success:
         raise RuntimeError(f"ODE integration failed: {sol.message}")
 
-    # sol.y has shape (n_states, N). We return (N, n_states).
-    t = np.asarray(sol.t, dtype=float)
-    x = np.asarray(sol.y.T, dtype=float)
+    # sol.y has shape (n_states, N) and is float64 already; we return its
+    # (N, n_states) transpose as a view unless a copy is requested.
+    t = sol.t
+    x = np.array(sol.y.T, order="C") if copy else sol.y.T
 
     if x.shape[1] != 3:
         raise RuntimeError(f"Unexpected state dimension returned by solver: {x.shape}")
 
     return t, x
+
+
+def integrate_system_batched(
+    params_list: Sequence[ParameterSet],
+    config: SimulationConfig,
+    x0_stack: np.ndarray,
+    t_eval: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Integrate K parameter sets over the same time grid in one solver run.
+
+    Intended for parameter sweeps (e.g. scanning pathology factors): the K
+    systems are stacked into one (3K,) state and their right-hand sides are
+    evaluated together by a single compiled call, so solve_ivp's per-step
+    Python overhead is paid once for the whole batch.
+
+    Parameters
+    ----------
+    params_list : sequence of ParameterSet
+        The K parameter sets.
+    config : SimulationConfig
+        Shared numerical configuration.
+    x0_stack : (K, 3) np.ndarray
+        Initial states, one row [pLV0, Q2_0, p1_0] per parameter set.
+    t_eval : np.ndarray
+        Time points where the solutions are sampled (strictly increasing).
+
+    Returns
+    -------
+    t : (N,) np.ndarray
+        Time vector.
+    X : (N, 3, K) np.ndarray
+        X[:, :, k] is the trajectory of params_list[k] (columns [pLV, Q2, p1]).
+        May be a view of the solver output; treat it as read-only.
+
+    Notes
+    -----
+    With solve_ivp methods, one step size is shared by all K systems and the
+    error norm is taken over the stacked state, so per-system accuracy can
+    be somewhat looser than in separate integrate_system runs. With
+    method="numba_dopri5" every system keeps its own step control (the
+    batch runs in parallel) and matches integrate_system exactly.
+    """
+    K = len(params_list)
+    if K == 0:
+        raise ValueError("params_list must contain at least one ParameterSet.")
+    x0_stack = np.asarray(x0_stack, dtype=float)
+    if x0_stack.shape != (K, 3):
+        raise ValueError(f"x0_stack must have shape (K, 3) = ({K}, 3), got {x0_stack.shape}.")
+    t_eval = _check_t_eval(t_eval)
+
+    if config.method == NUMBA_DOPRI5:
+        P, gates = rhs_args_batched(params_list)
+        X, status = dopri5_batch(
+            t_eval, np.ascontiguousarray(x0_stack), P, gates,
+            float(config.rtol), float(config.atol), _DOPRI5_STEP_LIMIT,
+        )
+        failed = np.flatnonzero(status != DOPRI5_SUCCESS)
+        if failed.size:
+            raise RuntimeError(f"ODE integration failed for parameter sets {failed.tolist()}")
+        return t_eval, X.transpose(1, 2, 0)
+
+    extra = {}
+    if config.method in _IMPLICIT_METHODS:
+        extra["jac"] = make_jac_batched(params_list)
+
+    sol = solve_ivp(
+        fun=make_rhs_batched(params_list),
+        t_span=(float(t_eval[0]), float(t_eval[-1])),
+        y0=x0_stack.reshape(-1),
+        method=config.method,
+        t_eval=t_eval,
+        rtol=config.rtol,
+        atol=config.atol,
+        vectorized=False,
+        **extra,
+    )
+
+    if not sol.success:
+        raise RuntimeError(f"ODE integration failed: {sol.message}")
+
+    # sol.y is (3K, N) with rows ordered [system, state]
+    return sol.t, sol.y.reshape(K, 3, -1).transpose(2, 1, 0)
+
+
+def _integrate_dopri5(
+    params: ParameterSet,
+    config: SimulationConfig,
+    x0: np.ndarray,
+    t_eval: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Run the compiled DOPRI5 driver (inputs already validated)."""
+    x, status = dopri5(
+        t_eval, x0, rhs_args(params), float(config.rtol), float(config.atol), _DOPRI5_STEP_LIMIT
+    )
+    if status != DOPRI5_SUCCESS:
+        reason = "maximum number of steps exceeded" if status == DOPRI5_MAX_STEPS else "step size too small"
+        raise RuntimeError(f"ODE integration failed: {reason}")
+
+    return t_eval, x
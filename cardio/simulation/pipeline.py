@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+from concurrent.futures import Executor
 from dataclasses import replace
-from typing import Optional
+from typing import Optional, Sequence
 
 import numpy as np
 
@@ -10,7 +11,55 @@ from cardio.params.dataclasses import ParameterSet, SimulationConfig, Simulation
 from cardio.simulation.initial_conditions import default_initial_state
 
 # integrate_system will be implemented in cardio/simulation/integrate.py
-from cardio.simulation.integrate import integrate_system
+from cardio.simulation.integrate import NUMBA_DOPRI5, integrate_system, integrate_system_batched
+
+
+def _output_grid(params: ParameterSet, config: SimulationConfig) -> tuple[np.ndarray, float]:
+    """
+    Sampled time grid of a run and the time integrated before its first point.
+
+    The second value is 0.0 unless config.dense_last_n_cycles skips cycles:
+    the skipped cycles are then integrated with output at their end point only,
+    and the tail of the full grid is sampled (same time values as a full run,
+    so last-cycle slicing is unchanged).
+    """
+    t_eval = make_time_grid(params.Tcc, config.n_cycles, config.points_per_cycle)
+
+    n_dense = config.dense_last_n_cycles
+    if n_dense is not None:
+        if n_dense < 1:
+            raise ValueError("dense_last_n_cycles must be >= 1 (or None).")
+        n_skip = int(config.n_cycles) - int(n_dense)
+        if n_skip > 0:
+            t_eval = t_eval[n_skip * int(config.points_per_cycle):]
+            return t_eval, float(t_eval[0])
+    return t_eval, 0.0
+
+
+def _make_result(
+    params: ParameterSet,
+    config: SimulationConfig,
+    t: np.ndarray,
+    x: np.ndarray,
+) -> SimulationResult:
+    """Wrap a trajectory in a SimulationResult with states and reconstructed signals."""
+    # Contiguous per-state arrays (a no-op view when x is column-major, as
+    # returned by solve_ivp; a copy for row-major x)
+    states = {name: np.ascontiguousarray(x[:, i]) for i, name in enumerate(("pLV", "Q2", "p1"))}
+
+    # Reconstruct derived signals (Vlv, valve flows, compliance, ...)
+    signals = reconstruct_signals(t=t, x=x, params=params, dtype=config.signal_dtype)
+
+    return SimulationResult(
+        t=t,
+        x=x,
+        params=params,
+        config=config,
+        states=states,
+        signals=signals,
+        metrics={},
+        notes={},
+    )
 
 
 def run_simulation(
@@ -32,23 +81,68 @@ def run_simulation(
     if x0 is None:
         x0 = default_initial_state(params)
 
-    t_eval = make_time_grid(params.Tcc, config.n_cycles, config.points_per_cycle)
+    t_eval, t_start = _output_grid(params, config)
+    if t_start > 0.0:
+        _, x_skip = integrate_system(
+            params=params, config=config, x0=x0, t_eval=np.array([0.0, t_start])
+        )
+        x0 = x_skip[-1]
 
     # Integrate ODEs (Eq.56–58 through models.systemic_nonlinear.rhs)
     t, x = integrate_system(params=params, config=config, x0=x0, t_eval=t_eval)
 
-    # Reconstruct derived signals (Vlv, valve flows, compliance, ...)
-    signals = reconstruct_signals(t=t, x=x, params=params)
+    return _make_result(params, config, t, x)
 
-    return SimulationResult(
-        t=t,
-        x=x,
-        params=params,
-        config=config,
-        signals=signals,
-        metrics={},
-        notes={},
-    )
+
+def run_simulations(
+    params_list: Sequence[ParameterSet],
+    config: SimulationConfig,
+    x0: Optional[np.ndarray] = None,
+) -> list[SimulationResult]:
+    """
+    Run several parameter sets (e.g. healthy + pathologies) with the same config.
+
+    Returns one SimulationResult per parameter set, in order.
+
+    With method="numba_dopri5" and a common Tcc, the sets are integrated
+    together by integrate_system_batched on one time grid. Every system keeps
+    its own step control there, so the results match separate run_simulation
+    calls (to round-off). Otherwise (solve_ivp methods, whose batched solve
+    would share one step size and error norm across the sets, or different
+    Tcc) each set is run by run_simulation.
+
+    x0 is None (default_initial_state of each set), one (3,) state shared by
+    all sets, or a (K, 3) stack with one row per set.
+    """
+    params_list = list(params_list)
+    K = len(params_list)
+    if K == 0:
+        raise ValueError("params_list must contain at least one ParameterSet.")
+
+    if x0 is None:
+        x0_stack = np.stack([default_initial_state(p) for p in params_list])
+    else:
+        x0_stack = np.asarray(x0, dtype=float)
+        if x0_stack.ndim == 1:
+            x0_stack = np.broadcast_to(x0_stack, (K, x0_stack.shape[0]))
+        if x0_stack.shape != (K, 3):
+            raise ValueError(f"x0 must have shape (3,) or ({K}, 3), got {x0_stack.shape}.")
+
+    if config.method != NUMBA_DOPRI5 or len({float(p.Tcc) for p in params_list}) > 1:
+        return [run_simulation(p, config, x0=x0_stack[k]) for k, p in enumerate(params_list)]
+
+    t_eval, t_start = _output_grid(params_list[0], config)
+    if t_start > 0.0:
+        _, X_skip = integrate_system_batched(params_list, config, x0_stack, np.array([0.0, t_start]))
+        x0_stack = X_skip[-1].T
+
+    t, X = integrate_system_batched(params_list, config, x0_stack, t_eval)
+
+    # Column-major copies, like the x of run_simulation
+    return [
+        _make_result(p, config, t, np.asfortranarray(X[:, :, k]))
+        for k, p in enumerate(params_list)
+    ]
 
 
 def run_scenario_pair(
@@ -56,14 +150,33 @@ def run_scenario_pair(
     pathological: ParameterSet,
     config: SimulationConfig,
     x0: Optional[np.ndarray] = None,
+    executor: Optional[Executor] = None,
 ) -> tuple[SimulationResult, SimulationResult]:
     """
     Convenience helper: run healthy and pathological simulations using the same config.
 
     This is mainly used by scripts (compare plots/metrics).
+
+    If x0 is given the two runs are independent: they go through
+    run_simulations (one batch with method="numba_dopri5") or, with an
+    executor (e.g. a concurrent.futures.ProcessPoolExecutor), are submitted
+    concurrently. Without x0 the pathological run is warm-started from the
+    final healthy state, so the runs stay sequential.
+
+    Use a process pool, created with a "spawn" or "forkserver" context:
+    LSODA keeps global Fortran state, so threads cannot integrate
+    concurrently, and the parallel Numba kernels start worker threads that a
+    forked child does not inherit, which can hang the pool at shutdown.
     """
+    if executor is not None and x0 is not None:
+        fut_h = executor.submit(run_simulation, healthy, config, x0)
+        fut_p = executor.submit(run_simulation, pathological, config, x0)
+        return fut_h.result(), fut_p.result()
+    if x0 is not None:
+        res_h, res_p = run_simulations([healthy, pathological], config, x0=x0)
+        return res_h, res_p
+
     res_h = run_simulation(healthy, config=config, x0=x0)
-    # Use final state of healthy as warm-start for pathological if x0 not provided
-    x0_path = res_h.x[-1, :] if x0 is None else x0
-    res_p = run_simulation(pathological, config=config, x0=x0_path)
+    # Use final state of healthy as warm-start for pathological
+    res_p = run_simulation(pathological, config=config, x0=res_h.x[-1, :])
     return res_h, res_p
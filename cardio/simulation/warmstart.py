@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import hashlib
+import os
+from dataclasses import fields
+from pathlib import Path
+
+import numpy as np
+
+from cardio.params.dataclasses import ParameterSet, SimulationConfig
+from cardio.simulation.initial_conditions import default_initial_state
+from cardio.simulation.integrate import integrate_system
+
+
+# Number of cycles integrated from default_initial_state to reach the
+# periodic steady state (the transient dies out within ~5 cycles).
+WARMUP_CYCLES = 20
+
+# Fields that only label a ParameterSet and do not affect the dynamics
+_NON_MODEL_FIELDS = ("label", "meta", "Rtot")
+
+# Part of every cache key: bump when the cached state or the warm-up
+# procedure changes, so stale files are not reused.
+_CACHE_VERSION = 1
+
+
+def warm_start_cache_dir() -> Path:
+    """
+    Directory of the on-disk warm-start cache.
+
+    $CARDIO_CACHE_DIR if set, otherwise ~/.cache/cardio.
+    """
+    env = os.environ.get("CARDIO_CACHE_DIR")
+    return Path(env) if env else Path.home() / ".cache" / "cardio"
+
+
+def _cache_key(params: ParameterSet, config: SimulationConfig) -> str:
+    """
+    Stable hash of everything the cached state depends on: the cache version,
+    the warm-up solver (method, rtol, atol) and the model inputs of `params`.
+
+    Unlike hash(params) it does not change between interpreter sessions
+    (str hashing is randomized), so it can name cache files.
+    """
+    items = [
+        f"version={_CACHE_VERSION}",
+        f"warmup_cycles={WARMUP_CYCLES}",
+        f"method={config.method}",
+        f"rtol={float(config.rtol)!r}",
+        f"atol={float(config.atol)!r}",
+    ]
+    items += [
+        f"{f.name}={getattr(params, f.name)!r}"
+        for f in fields(params)
+        if f.name not in _NON_MODEL_FIELDS
+    ]
+    return hashlib.sha1(";".join(items).encode()).hexdigest()[:16]
+
+
+def get_warm_start(params: ParameterSet, config: SimulationConfig | None = None) -> np.ndarray:
+    """
+    Periodic steady-state initial condition [pLV0, Q2_0, p1_0] for `params`.
+
+    On the first call for a given parameter set and solver setting, integrates
+    WARMUP_CYCLES cycles from default_initial_state (sampling only the end
+    point) and stores the final state as warmstart_<hash>.npy in
+    warm_start_cache_dir().
+    Later calls, also from other scripts and sessions, load that file.
+    Passing the result as x0 to run_simulation skips the initial transient,
+    so fewer cycles are needed to reach steady state. Warm-start each
+    parameter set with its own state: a pathological set is not at steady
+    state on the healthy orbit.
+
+    config only selects the solver and tolerances of the warm-up run; they
+    are part of the cache key, so each solver setting gets its own state.
+    """
+    config = SimulationConfig() if config is None else config
+    path = warm_start_cache_dir() / f"warmstart_{_cache_key(params, config)}.npy"
+    try:
+        x0 = np.load(path)
+        if x0.shape == (3,) and np.all(np.isfinite(x0)):
+            return x0
+    except (OSError, ValueError):
+        pass  # missing or unreadable: recompute
+
+    t_eval = np.array([0.0, WARMUP_CYCLES * float(params.Tcc)])
+    _, x = integrate_system(params, config, default_initial_state(params), t_eval)
+    x0 = np.array(x[-1], dtype=float)
+
+    # Write to a temporary file then rename, so a concurrent reader never
+    # sees a partial file. A read-only cache location is not an error.
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.stem}.{os.getpid()}.tmp.npy")
+        np.save(tmp, x0)
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+    return x0
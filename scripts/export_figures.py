@@ -1,28 +1,28 @@
 from __future__ import annotations
 
+from dataclasses import replace
 from pathlib import Path
 
+import matplotlib
+
+matplotlib.use("Agg")  # file export only: no GUI backend
+
 import matplotlib.pyplot as plt
 
 from cardio.analysis.metrics import compute_all_metrics
 from cardio.config.defaults import get_default_config, get_default_healthy_params
 from cardio.params.pathology import combined_stiffness_and_afterload
+from cardio.plotting.export import save_figure
 from cardio.plotting.plots import plot_clv, plot_p1, plot_pv_loop, plot_q2, plot_valve_flows
 from cardio.simulation.pipeline import run_scenario_pair
 
 
-def _save(fig, outdir: Path, name: str, dpi: int = 300) -> None:
-    out_png = outdir / f"{name}.png"
-    out_pdf = outdir / f"{name}.pdf"
-    fig.savefig(out_png, dpi=dpi, bbox_inches="tight")
-    fig.savefig(out_pdf, bbox_inches="tight")
-
-
 def main() -> None:
     outdir = Path("exports") / "figures"
     outdir.mkdir(parents=True, exist_ok=True)
 
-    config = get_default_config()
+    # LSODA (with the analytical Jacobian) is much faster than the RK45 default
+    config = replace(get_default_config(), method="LSODA")
     healthy = get_default_healthy_params()
 
     pathology = combined_stiffness_and_afterload(
@@ -43,36 +43,26 @@ def main() -> None:
     print("Healthy p1 SBP/DBP:", f"{mh['p1_SBP']:.2f}/{mh['p1_DBP']:.2f} mmHg")
     print("Path   p1 SBP/DBP:", f"{mp['p1_SBP']:.2f}/{mp['p1_DBP']:.2f} mmHg")
 
-    # 1) Compliance over full simulation
-    fig1, ax1 = plt.subplots()
-    plot_clv(res_h, show_last_cycle=False, ax=ax1)
-    # Pathology has identical LV compliance in this scenario (same Cmin/Cmax), so we don't overlay.
-    _save(fig1, outdir, "01_clv_time")
-    plt.close(fig1)
-
-    # 2) Arterial pressure (last cycle)
-    fig2, ax2 = plt.subplots()
-    plot_p1(res_h, pathology=res_p, last_cycle=True, ax=ax2)
-    _save(fig2, outdir, "02_p1_last_cycle_compare")
-    plt.close(fig2)
-
-    # 3) PV loop (last cycle)
-    fig3, ax3 = plt.subplots()
-    plot_pv_loop(res_h, pathology=res_p, last_cycle=True, ax=ax3)
-    _save(fig3, outdir, "03_pv_loop_last_cycle_compare")
-    plt.close(fig3)
-
-    # 4) Valve flows (last cycle)
-    fig4, ax4 = plt.subplots()
-    plot_valve_flows(res_h, pathology=res_p, last_cycle=True, ax=ax4)
-    _save(fig4, outdir, "04_valve_flows_last_cycle_compare")
-    plt.close(fig4)
-
-    # 5) Peripheral flow Q2 (last cycle)
-    fig5, ax5 = plt.subplots()
-    plot_q2(res_h, pathology=res_p, last_cycle=True, ax=ax5)
-    _save(fig5, outdir, "05_q2_last_cycle_compare")
-    plt.close(fig5)
+    # One figure is reused for all exports; each plot starts from ax.clear().
+    fig, ax = plt.subplots()
+    exports = (
+        # 1) Compliance over full simulation. Pathology has identical LV
+        #    compliance in this scenario (same Cmin/Cmax), so we don't overlay.
+        ("01_clv_time", lambda ax: plot_clv(res_h, show_last_cycle=False, ax=ax)),
+        # 2) Arterial pressure (last cycle)
+        ("02_p1_last_cycle_compare", lambda ax: plot_p1(res_h, pathology=res_p, last_cycle=True, ax=ax)),
+        # 3) PV loop (last cycle)
+        ("03_pv_loop_last_cycle_compare", lambda ax: plot_pv_loop(res_h, pathology=res_p, last_cycle=True, ax=ax)),
+        # 4) Valve flows (last cycle)
+        ("04_valve_flows_last_cycle_compare", lambda ax: plot_valve_flows(res_h, pathology=res_p, last_cycle=True, ax=ax)),
+        # 5) Peripheral flow Q2 (last cycle)
+        ("05_q2_last_cycle_compare", lambda ax: plot_q2(res_h, pathology=res_p, last_cycle=True, ax=ax)),
+    )
+    for name, plot in exports:
+        ax.clear()
+        plot(ax)
+        save_figure(fig, outdir, name)
+    plt.close(fig)
 
     print("Done.")
 
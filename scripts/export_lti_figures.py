@@ -3,43 +3,45 @@ from __future__ import annotations
 from pathlib import Path
 
 import numpy as np
+import matplotlib
+
+matplotlib.use("Agg")  # file export only: no GUI backend
+
 import matplotlib.pyplot as plt
-from scipy import signal
 
 from cardio.params.healthy import healthy_params
 # from cardio.params.pathology import 
 from cardio.params.pathology import arterial_stiffening_combo
 
 from cardio.analysis.linearization import (
+    ArterialLTI,
+    arterial_impulse_step,
     build_arterial_lti,
     arterial_poles_zeros_from_tf,
 )
+from cardio.plotting.export import save_figure
 from cardio.plotting.lti_plots import plot_pole_zero_map
 
 
-def _save(fig: plt.Figure, outdir: Path, name: str, dpi: int = 300) -> None:
-    out_png = outdir / f"{name}.png"
-    out_pdf = outdir / f"{name}.pdf"
-    fig.savefig(out_png, dpi=dpi, bbox_inches="tight")
-    fig.savefig(out_pdf, bbox_inches="tight", format="pdf")
-
-
-def _impulse(sys_tf: signal.TransferFunction, t: np.ndarray) -> np.ndarray:
-    _, y = signal.impulse(sys_tf, T=t)
-    return np.asarray(y, dtype=float)
-
-
-def _step(sys_tf: signal.TransferFunction, t: np.ndarray) -> np.ndarray:
-    _, y = signal.step(sys_tf, T=t)
-    return np.asarray(y, dtype=float)
+def _impulse_step(lti: ArterialLTI, t: np.ndarray):
+    # closed form from the TF poles/residues (no TF->SS conversion or ODE solve)
+    return arterial_impulse_step(lti.a0, lti.a1, lti.b0, lti.b1, t)
 
 
-def _bode(sys_tf: signal.TransferFunction, w: np.ndarray):
-    _, H = signal.freqresp(sys_tf, w=w)
-    H = np.asarray(H)
-    mag = np.abs(H)
+def _bode(lti: ArterialLTI, jw: np.ndarray, w2: np.ndarray):
+    # H(jw) = (b1*jw + b0) / ((a0 - w^2) + a1*jw), from the shared jw and w^2
+    den = lti.a1 * jw
+    den += lti.a0 - w2
+    H = lti.b1 * jw
+    H += lti.b0
+    H /= den
+    # magnitude in dB, converted in place in the fresh |H| buffer
+    mag_db = np.abs(H)
+    np.maximum(mag_db, 1e-30, out=mag_db)
+    np.log10(mag_db, out=mag_db)
+    mag_db *= 20.0
     phase_deg = np.angle(H, deg=True)
-    return mag, phase_deg
+    return mag_db, phase_deg
 
 
 def main() -> None:
@@ -61,14 +63,14 @@ def main() -> None:
     # ------------------------------------------------------------------
     # 1) Pole-zero map (overlay)
     # ------------------------------------------------------------------
-    fig1, ax1 = plt.subplots()
-    plot_pole_zero_map(poles_h, zeros_h, title="Arterial Windkessel LTI — Pole-zero map", ax=ax1)
+    # Figures 1–3 share one single-axes figure (ax.clear() between exports)
+    fig, ax = plt.subplots()
+    plot_pole_zero_map(poles_h, zeros_h, title="Arterial Windkessel LTI — Pole-zero map", ax=ax)
     # overlay pathology with different markers/colors without styling overload
-    ax1.scatter(np.real(zeros_p), np.imag(zeros_p), marker="o", facecolors="none", edgecolors="tab:blue", label="zeros (Hypertension with arterial stiffening)")
-    ax1.scatter(np.real(poles_p), np.imag(poles_p), marker="x", color="tab:blue", label="poles (Hypertension with arterial stiffening)")
-    ax1.legend(loc="best")
-    _save(fig1, outdir, "lti_01_pole_zero_map_compare")
-    plt.close(fig1)
+    ax.scatter(np.real(zeros_p), np.imag(zeros_p), marker="o", facecolors="none", edgecolors="tab:blue", label="zeros (Hypertension with arterial stiffening)")
+    ax.scatter(np.real(poles_p), np.imag(poles_p), marker="x", color="tab:blue", label="poles (Hypertension with arterial stiffening)")
+    ax.legend(loc="best")
+    save_figure(fig, outdir, "lti_01_pole_zero_map_compare")
 
     # Common time grid for time responses
     t_end = 5.0
@@ -77,49 +79,48 @@ def main() -> None:
     # ------------------------------------------------------------------
     # 2) Impulse response (overlay)
     # ------------------------------------------------------------------
-    y_imp_h = _impulse(lti_h.sys_tf, t)
-    y_imp_p = _impulse(lti_p.sys_tf, t)
-
-    fig2, ax2 = plt.subplots()
-    ax2.plot(t, y_imp_h, label="healthy")
-    ax2.plot(t, y_imp_p, label="Hypertension with arterial stiffening")
-    ax2.set_title("Impulse response: Δp1 / ΔQin")
-    ax2.set_xlabel("Time (s)")
-    ax2.set_ylabel("Δp1 (arb. units)")
-    ax2.grid(True, linestyle="--", linewidth=0.5)
-    ax2.legend(loc="best")
-    _save(fig2, outdir, "lti_02_impulse_response_compare")
-    plt.close(fig2)
+    y_imp_h, y_step_h = _impulse_step(lti_h, t)
+    y_imp_p, y_step_p = _impulse_step(lti_p, t)
+
+    ax.clear()
+    ax.plot(t, y_imp_h, label="healthy")
+    ax.plot(t, y_imp_p, label="Hypertension with arterial stiffening")
+    ax.set_title("Impulse response: Δp1 / ΔQin")
+    ax.set_xlabel("Time (s)")
+    ax.set_ylabel("Δp1 (arb. units)")
+    ax.grid(True, linestyle="--", linewidth=0.5)
+    ax.legend(loc="best")
+    save_figure(fig, outdir, "lti_02_impulse_response_compare")
 
     # ------------------------------------------------------------------
     # 3) Step response (overlay)
     # ------------------------------------------------------------------
-    y_step_h = _step(lti_h.sys_tf, t)
-    y_step_p = _step(lti_p.sys_tf, t)
-
-    fig3, ax3 = plt.subplots()
-    ax3.plot(t, y_step_h, label="healthy")
-    ax3.plot(t, y_step_p, label="Hypertension with arterial stiffening")
-    ax3.set_title("Step response: Δp1 / ΔQin")
-    ax3.set_xlabel("Time (s)")
-    ax3.set_ylabel("Δp1 (arb. units)")
-    ax3.grid(True, linestyle="--", linewidth=0.5)
-    ax3.legend(loc="best")
-    _save(fig3, outdir, "lti_03_step_response_compare")
-    plt.close(fig3)
+    ax.clear()
+    ax.plot(t, y_step_h, label="healthy")
+    ax.plot(t, y_step_p, label="Hypertension with arterial stiffening")
+    ax.set_title("Step response: Δp1 / ΔQin")
+    ax.set_xlabel("Time (s)")
+    ax.set_ylabel("Δp1 (arb. units)")
+    ax.grid(True, linestyle="--", linewidth=0.5)
+    ax.legend(loc="best")
+    save_figure(fig, outdir, "lti_03_step_response_compare")
+    plt.close(fig)
 
     # ------------------------------------------------------------------
     # 4) Bode (magnitude + phase) — overlay
     # ------------------------------------------------------------------
     w = np.logspace(-2, 3, 1200)  # rad/s
-    mag_h, ph_h = _bode(lti_h.sys_tf, w)
-    mag_p, ph_p = _bode(lti_p.sys_tf, w)
+    # frequency basis shared by both systems
+    jw = 1j * w
+    w2 = w * w
+    mag_db_h, ph_h = _bode(lti_h, jw, w2)
+    mag_db_p, ph_p = _bode(lti_p, jw, w2)
 
     fig4, (ax4a, ax4b) = plt.subplots(2, 1, sharex=True)
     fig4.suptitle("Bode plot: Δp1 / ΔQin")
 
-    ax4a.semilogx(w, 20.0 * np.log10(np.maximum(mag_h, 1e-30)), label="healthy")
-    ax4a.semilogx(w, 20.0 * np.log10(np.maximum(mag_p, 1e-30)), label="Hypertension with arterial stiffening")
+    ax4a.semilogx(w, mag_db_h, label="healthy")
+    ax4a.semilogx(w, mag_db_p, label="Hypertension with arterial stiffening")
     ax4a.set_ylabel("Magnitude (dB)")
     ax4a.grid(True, which="both", linestyle="--", linewidth=0.5)
     ax4a.legend(loc="best")
@@ -130,7 +131,7 @@ def main() -> None:
     ax4b.set_xlabel("Frequency ω (rad/s)")
     ax4b.grid(True, which="both", linestyle="--", linewidth=0.5)
 
-    _save(fig4, outdir, "lti_04_bode_compare")
+    save_figure(fig4, outdir, "lti_04_bode_compare")
     plt.close(fig4)
 
     print("Done.")
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import matplotlib.pyplot as plt
+import numpy as np
 
 from cardio.analysis.metrics import compute_all_metrics
 from cardio.params.dataclasses import SimulationConfig
@@ -13,7 +14,8 @@ from cardio.params.pathology import (
     
 )
 from cardio.plotting.plots import plot_clv, plot_p1, plot_pv_loop, plot_q2, plot_valve_flows
-from cardio.simulation.pipeline import run_scenario_pair
+from cardio.simulation.pipeline import run_simulations
+from cardio.simulation.warmstart import get_warm_start
 
 
 def _print_comparison(title: str, mh: dict, mp: dict, keys: list[str]) -> None:
@@ -59,17 +61,21 @@ def main() -> None:
 
 
     # --- simulation config ---
+    # Each run starts on its own periodic steady state (cached warm starts
+    # below), so a few cycles are enough; the first run also pays for the
+    # warm-ups.
     config = SimulationConfig(
-        n_cycles=10,
+        n_cycles=5,
         points_per_cycle=800,
-        method="RK45",
+        method="LSODA",
         rtol=1e-6,
         atol=1e-8,
         enable_steady_state_check=False,  # (not implemented yet)
     )
 
-    # --- run pair (warm-start pathology from healthy final state) ---
-    res_h, res_p = run_scenario_pair(healthy=healthy, pathological=path, config=config)
+    # --- run pair (each from its cached steady state) ---
+    x0 = np.stack([get_warm_start(p, config) for p in (healthy, path)])
+    res_h, res_p = run_simulations([healthy, path], config=config, x0=x0)
 
     # --- compute metrics on last cycle ---
     mh = compute_all_metrics(res_h.signals, res_h.t, res_h.params.Tcc, valve_threshold=0.01)
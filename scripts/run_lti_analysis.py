@@ -83,6 +83,7 @@ def analyze_case(label: str, params):
         sys_tf=lti.sys_tf,
         title_prefix=f"{label}",
         t_end=5.0,
+        sys_ss=lti.sys_ss,
     )
 
 
@@ -1,6 +1,6 @@
 import numpy as np
 
-from cardio.physiology.activation import ecc, decc_dt, tvc_tvr
+from cardio.physiology.activation import cycle_time, ecc, decc_dt, tvc_tvr
 
 
 def test_activation_bounds():
@@ -23,18 +23,17 @@ def test_activation_periodicity_via_modulo():
     rng = np.random.default_rng(0)
     t_abs = rng.uniform(0.0, 10.0, size=50)
 
-    for t in t_abs:
-        tau0 = np.mod(t, Tcc)
-        tau1 = np.mod(t + Tcc, Tcc)
-        tau2 = np.mod(t + 2 * Tcc, Tcc)
+    tau0 = np.mod(t_abs, Tcc)
+    tau1 = np.mod(t_abs + Tcc, Tcc)
+    tau2 = np.mod(t_abs + 2 * Tcc, Tcc)
 
-        y0 = float(ecc(tau0, Tvc=Tvc, Tvr=Tvr, Tcc=Tcc))
-        y1 = float(ecc(tau1, Tvc=Tvc, Tvr=Tvr, Tcc=Tcc))
-        y2 = float(ecc(tau2, Tvc=Tvc, Tvr=Tvr, Tcc=Tcc))
+    y0 = ecc(tau0, Tvc=Tvc, Tvr=Tvr, Tcc=Tcc)
+    y1 = ecc(tau1, Tvc=Tvc, Tvr=Tvr, Tcc=Tcc)
+    y2 = ecc(tau2, Tvc=Tvc, Tvr=Tvr, Tcc=Tcc)
 
-        assert np.isfinite(y0)
-        assert abs(y0 - y1) < 1e-12
-        assert abs(y0 - y2) < 1e-12
+    assert np.all(np.isfinite(y0))
+    np.testing.assert_allclose(y0, y1, rtol=0.0, atol=1e-12)
+    np.testing.assert_allclose(y0, y2, rtol=0.0, atol=1e-12)
 
 
 def test_activation_derivative_finite_and_consistent():
@@ -67,3 +66,53 @@ def test_activation_rest_phase_is_zero():
 
     assert np.all(np.isfinite(y))
     assert np.max(np.abs(y)) < 1e-12
+
+
+def test_activation_outside_active_phases_is_exactly_zero():
+    Tcc = 0.8
+    Tvc, Tvr = tvc_tvr(Tcc)
+
+    # before the cycle start and during rest
+    tau = np.concatenate([np.linspace(-0.3, -1e-9, 50), np.linspace(Tvc + Tvr + 1e-9, Tcc, 50)])
+    assert np.all(ecc(tau, Tvc=Tvc, Tvr=Tvr, Tcc=Tcc) == 0.0)
+    assert np.all(decc_dt(tau, Tvc=Tvc, Tvr=Tvr, Tcc=Tcc) == 0.0)
+
+    # peak at end of contraction
+    assert abs(ecc(Tvc, Tvc=Tvc, Tvr=Tvr, Tcc=Tcc) - 1.0) < 1e-15
+
+
+def test_cycle_time_scalar_matches_array():
+    Tcc = 0.8
+    t = np.array([-1.3, -0.1, 0.0, 0.25, 0.8, 1.7, 12.345])
+    tau_arr = cycle_time(t, Tcc)
+
+    for ti, tau_i in zip(t, tau_arr):
+        tau_s = cycle_time(float(ti), Tcc)
+        assert 0.0 <= tau_s < Tcc
+        assert abs(tau_s - tau_i) < 1e-12
+
+
+def test_activation_sorted_and_unsorted_paths_agree():
+    Tcc = 0.8
+    Tvc, Tvr = tvc_tvr(Tcc)
+
+    tau = np.linspace(-0.1, Tcc, 4001)
+    perm = np.random.default_rng(0).permutation(tau.size)
+
+    for f in (ecc, decc_dt):
+        y_sorted = f(tau, Tvc=Tvc, Tvr=Tvr, Tcc=Tcc)
+        y_shuffled = f(tau[perm], Tvc=Tvc, Tvr=Tvr, Tcc=Tcc)
+        np.testing.assert_allclose(y_shuffled, y_sorted[perm], rtol=0, atol=1e-12)
+
+
+def test_activation_scalar_path_matches_array_path():
+    Tcc = 0.8
+    Tvc, Tvr = tvc_tvr(Tcc)
+    tau = np.array([-0.05, 0.0, 0.1, Tvc, Tvc + 0.01, Tvc + Tvr, 0.5, 0.79])
+
+    for f in (ecc, decc_dt):
+        y = f(tau, Tvc=Tvc, Tvr=Tvr, Tcc=Tcc)
+        for ti, yi in zip(tau, y):
+            v = f(float(ti), Tvc=Tvc, Tvr=Tvr, Tcc=Tcc)
+            assert isinstance(v, float)
+            assert abs(v - yi) < 1e-12
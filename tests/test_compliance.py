@@ -1,7 +1,9 @@
 import numpy as np
 
+from cardio.models.signals import reconstruct_signals
 from cardio.params.healthy import healthy_params
-from cardio.physiology.compliance import clv, dclv_dt, elv
+from cardio.physiology.activation import build_activation_lut
+from cardio.physiology.compliance import clv, clv_and_dclv, dclv_dt, elv
 
 
 def test_clv_bounds_over_multiple_cycles():
@@ -9,7 +11,9 @@ def test_clv_bounds_over_multiple_cycles():
     Tcc = params.Tcc
 
     t = np.linspace(0.0, 5.0 * Tcc, 5000)
-    C = clv(t, params)
+    buf = np.empty_like(t)
+    C = clv(t, params, out=buf)
+    assert C is buf
 
     assert np.all(np.isfinite(C))
     assert np.min(C) >= params.Cmin - 1e-9
@@ -34,17 +38,16 @@ def test_dclv_dt_matches_finite_difference_sanity():
     eps = 1e-6
     safe_times = np.array([0.05, 0.15, 0.35, 0.55]) * Tcc
 
-    for t0 in safe_times:
-        dC_ana = float(dclv_dt(t0, params))
-        assert np.isfinite(dC_ana)
+    dC_ana = dclv_dt(safe_times, params)
+    assert np.all(np.isfinite(dC_ana))
 
-        C_plus = float(clv(t0 + eps, params))
-        C_minus = float(clv(t0 - eps, params))
-        dC_num = (C_plus - C_minus) / (2 * eps)
+    C_plus = clv(safe_times + eps, params)
+    C_minus = clv(safe_times - eps, params)
+    dC_num = (C_plus - C_minus) / (2 * eps)
 
-        assert np.isfinite(dC_num)
-        # loose tolerance: we just want a sanity check
-        assert abs(dC_ana - dC_num) < 1e-2
+    assert np.all(np.isfinite(dC_num))
+    # loose tolerance: we just want a sanity check
+    assert np.max(np.abs(dC_ana - dC_num)) < 1e-2
 
 
 def test_elv_is_inverse_of_clv():
@@ -53,7 +56,7 @@ def test_elv_is_inverse_of_clv():
 
     t = np.linspace(0.0, 2.0 * Tcc, 2000)
     C = clv(t, params)
-    E = elv(t, params)
+    E = elv(t, params, out=np.empty_like(t))
 
     assert np.all(np.isfinite(C))
     assert np.all(np.isfinite(E))
@@ -61,3 +64,59 @@ def test_elv_is_inverse_of_clv():
     # E*C should be ~1
     prod = np.asarray(C) * np.asarray(E)
     assert np.max(np.abs(prod - 1.0)) < 1e-9
+
+
+def test_reconstructed_compliance_signals_match_reference():
+    params = healthy_params()
+    Tcc = params.Tcc
+
+    t = np.linspace(0.0, 3.0 * Tcc, 2401)
+    x = np.column_stack([
+        10.0 + 5.0 * np.sin(t),
+        np.zeros_like(t),
+        np.full_like(t, 80.0),
+    ])
+    sig = reconstruct_signals(t, x, params)
+
+    np.testing.assert_allclose(sig["Clv"], clv(t, params), rtol=1e-10)
+    np.testing.assert_allclose(sig["dClv_dt"], dclv_dt(t, params), rtol=1e-9, atol=1e-9)
+    np.testing.assert_allclose(sig["Elv"], elv(t, params), rtol=1e-10)
+    np.testing.assert_allclose(sig["Vlv"], params.Vr + clv(t, params) * x[:, 0], rtol=1e-10)
+
+
+def test_clv_with_activation_lut_approximates_exact():
+    params = healthy_params()
+    lut = build_activation_lut(params.Tcc)
+    assert build_activation_lut(params.Tcc) is lut
+
+    t = np.linspace(0.0, 3.0 * params.Tcc, 20001)
+    C = clv(t, params)
+    dC = dclv_dt(t, params)
+
+    assert np.max(np.abs(clv(t, params, lut=lut) - C)) < 1e-3 * np.max(C)
+    assert np.max(np.abs(dclv_dt(t, params, lut=lut) - dC)) < 5e-2 * np.max(np.abs(dC))
+    assert isinstance(clv(0.3, params, lut=lut), float)
+
+
+def test_clv_and_dclv_matches_separate_calls():
+    params = healthy_params()
+    t = np.linspace(0.0, 3.0 * params.Tcc, 5001)
+
+    C, dC = clv_and_dclv(t, params)
+    np.testing.assert_allclose(C, clv(t, params), rtol=1e-13)
+    np.testing.assert_allclose(dC, dclv_dt(t, params), rtol=1e-12, atol=1e-12)
+
+    C0, dC0 = clv_and_dclv(0.2, params)
+    assert isinstance(C0, float) and isinstance(dC0, float)
+    assert abs(C0 - clv(0.2, params)) < 1e-13
+
+
+def test_compliance_out_buffer_matches_allocating_call():
+    params = healthy_params()
+    t = np.linspace(0.0, 3.0 * params.Tcc, 3001)
+    buf = np.empty_like(t)
+
+    for f in (clv, dclv_dt, elv):
+        expected = f(t, params)
+        assert f(t, params, out=buf) is buf
+        np.testing.assert_array_equal(buf, expected)
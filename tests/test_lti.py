@@ -0,0 +1,148 @@
+import pickle
+from dataclasses import replace
+
+import numpy as np
+import pytest
+from scipy import linalg, signal
+
+from cardio.analysis.linearization import (
+    arterial_impulse_step,
+    arterial_lti_matrices,
+    arterial_poles_zeros_from_tf,
+    arterial_tf_coeffs,
+    build_arterial_lti,
+    evaluate_arterial_tf,
+)
+from cardio.analysis.observability import (
+    observability_checks,
+    observability_gramian_eigs,
+    observability_matrix,
+)
+from cardio.params.healthy import healthy_params
+from cardio.params.pathology import arterial_stiffening_combo
+from cardio.plotting.lti_plots import _impulse_and_step
+
+
+def test_evaluate_arterial_tf_matches_freqresp():
+    w = np.logspace(-2, 3, 500)
+    for params in (healthy_params(), arterial_stiffening_combo(healthy_params())):
+        lti = build_arterial_lti(params)
+        _, H_ref = signal.freqresp(lti.sys_tf, w=w)
+        H = evaluate_arterial_tf(lti.a0, lti.a1, lti.b0, lti.b1, 1j * w)
+
+        np.testing.assert_allclose(H, H_ref, rtol=1e-10)
+
+
+def test_parameter_set_is_hashable_and_lti_builders_are_cached():
+    params = healthy_params()
+    assert healthy_params() is params
+    same = replace(params)  # equal but distinct instance
+
+    assert same is not params and hash(params) == hash(same)
+    assert arterial_tf_coeffs(params) is arterial_tf_coeffs(same)
+
+    A, B, C, D = arterial_lti_matrices(params)
+    assert arterial_lti_matrices(same)[0] is A
+    assert not A.flags.writeable
+
+
+def test_parameter_set_meta_is_frozen_and_picklable():
+    params = replace(healthy_params(), meta={"source": "test"})
+    with pytest.raises(TypeError):
+        params.meta["source"] = "changed"
+
+    # label/meta do not enter the hash, only equality
+    relabeled = replace(params, label="other", meta={})
+    assert hash(relabeled) == hash(params)
+    assert relabeled != params
+
+    restored = pickle.loads(pickle.dumps(params))
+    assert restored == params and hash(restored) == hash(params)
+    assert dict(restored.meta) == {"source": "test"}
+
+
+def test_poles_zeros_match_np_roots():
+    cases = [
+        (1e4, 3000.0, 3e7, 1e4),   # overdamped (healthy-like)
+        (4.0, 4.0, 1.0, 2.0),      # critically damped
+        (25.0, 2.0, 3.0, 1.0),     # underdamped
+    ]
+    for a0, a1, b0, b1 in cases:
+        poles, zeros = arterial_poles_zeros_from_tf(a0, a1, b0, b1)
+        np.testing.assert_allclose(np.sort_complex(poles), np.sort_complex(np.roots([1.0, a1, a0])), rtol=1e-7)
+        np.testing.assert_allclose(zeros, np.roots([b1, b0]), rtol=1e-12)
+
+
+def test_observability_matrix_blocks():
+    rng = np.random.default_rng(2)
+    A = rng.normal(size=(4, 4))
+    C = rng.normal(size=(2, 4))
+
+    O = observability_matrix(A, C)
+    ref = np.vstack([C @ np.linalg.matrix_power(A, k) for k in range(4)])
+    np.testing.assert_allclose(O, ref, rtol=1e-12, atol=1e-12)
+
+
+def test_observability_checks_match_numpy():
+    lti = build_arterial_lti(healthy_params())
+    rep = observability_checks(lti.A, lti.C)
+    O = observability_matrix(lti.A, lti.C)
+
+    assert rep.rank == np.linalg.matrix_rank(O) == 2
+    assert abs(rep.cond - np.linalg.cond(O)) <= 1e-9 * np.linalg.cond(O)
+
+    rank_deficient = observability_checks(np.eye(2), np.array([[1.0, 1.0]]))
+    assert rank_deficient.rank == 1
+    assert rank_deficient.cond > 1e12
+
+
+def test_gramian_2x2_closed_form_matches_lapack():
+    for params in (healthy_params(), arterial_stiffening_combo(healthy_params())):
+        lti = build_arterial_lti(params)
+        W, eigs = observability_gramian_eigs(lti.A, lti.C)
+
+        W_ref = linalg.solve_continuous_lyapunov(lti.A.T, -(lti.C.T @ lti.C))
+        np.testing.assert_allclose(W, W_ref, rtol=1e-10, atol=1e-14)
+        np.testing.assert_allclose(eigs, np.sort(np.linalg.eigvalsh(W_ref))[::-1], rtol=1e-10, atol=1e-14)
+
+
+def test_rtot_is_derived_from_rart_and_rcap():
+    params = healthy_params()
+    assert params.Rtot == params.Rart + params.Rcap
+
+    stiff = arterial_stiffening_combo(params)
+    assert stiff.Rtot == stiff.Rart + stiff.Rcap
+
+    # the LTI sub-model sees the same resistance as the nonlinear model
+    a0, a1, b0, b1 = arterial_tf_coeffs(params)
+    assert abs(a1 - params.Rtot / params.Iart) <= 1e-12 * a1
+
+
+def test_fused_impulse_step_match_scipy():
+    for params in (healthy_params(), arterial_stiffening_combo(healthy_params())):
+        lti = build_arterial_lti(params)
+        T = np.linspace(0.0, 5.0, 2000)
+        _, y_imp_ref = signal.impulse(lti.sys_tf, T=T)
+        _, y_step_ref = signal.step(lti.sys_tf, T=T)
+
+        for sys in (lti.sys_tf, lti.sys_ss):
+            t, y_imp, y_step = _impulse_and_step(sys, 5.0, 2000)
+            np.testing.assert_allclose(t, T)
+            np.testing.assert_allclose(y_imp, y_imp_ref, rtol=1e-10, atol=1e-12 * np.abs(y_imp_ref).max())
+            np.testing.assert_allclose(y_step, y_step_ref, rtol=1e-10, atol=1e-12 * np.abs(y_step_ref).max())
+
+        assert _impulse_and_step(lti.sys_tf, 5.0, 2000)[1] is _impulse_and_step(lti.sys_tf, 5.0, 2000)[1]
+
+
+def test_closed_form_impulse_step_match_scipy():
+    T = np.linspace(0.0, 5.0, 2000)
+    lti = build_arterial_lti(arterial_stiffening_combo(healthy_params()))
+    # distinct (model) poles, then a repeated pole (s + 2)^2
+    for a0, a1, b0, b1 in ((lti.a0, lti.a1, lti.b0, lti.b1), (4.0, 4.0, 3.0, 1.0)):
+        sys_tf = signal.TransferFunction([b1, b0], [1.0, a1, a0])
+        _, y_imp_ref = signal.impulse(sys_tf, T=T)
+        _, y_step_ref = signal.step(sys_tf, T=T)
+
+        y_imp, y_step = arterial_impulse_step(a0, a1, b0, b1, T)
+        np.testing.assert_allclose(y_imp, y_imp_ref, rtol=1e-10, atol=1e-12 * np.abs(y_imp_ref).max())
+        np.testing.assert_allclose(y_step, y_step_ref, rtol=1e-10, atol=1e-12 * np.abs(y_step_ref).max())
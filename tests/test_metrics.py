@@ -0,0 +1,135 @@
+from dataclasses import replace
+
+import numpy as np
+
+from cardio.analysis.metrics import (
+    _last_cycle_mask,
+    _last_cycle_slice,
+    _trapz_mean,
+    arterial_pressure_metrics,
+    compute_all_metrics,
+    compute_all_metrics_batch,
+    flow_metrics,
+    stroke_volume,
+    valve_timing_metrics,
+)
+from cardio.params.dataclasses import SimulationConfig, make_time_grid
+from cardio.params.healthy import healthy_params
+from cardio.simulation.pipeline import run_simulation
+
+
+def test_last_cycle_slice_matches_mask():
+    Tcc = 0.8
+    for n_cycles, ppc in [(1, 10), (3, 200), (10, 800), (7, 333)]:
+        t = make_time_grid(Tcc, n_cycles, ppc)
+        mask = _last_cycle_mask(t, Tcc)
+        sl = _last_cycle_slice(t, Tcc)
+
+        np.testing.assert_array_equal(t[sl], t[mask])
+
+    # non-uniform (but increasing) sampling
+    rng = np.random.default_rng(0)
+    t = np.cumsum(rng.uniform(1e-3, 5e-3, size=2000))
+    np.testing.assert_array_equal(t[_last_cycle_slice(t, Tcc)], t[_last_cycle_mask(t, Tcc)])
+
+
+def test_segment_metrics_match_numpy_reference():
+    t = np.linspace(0.0, 0.8, 801)
+    y = 80.0 + 40.0 * np.sin(2 * np.pi * t / 0.8) ** 2 + 3.0 * np.cos(17.0 * t)
+    mean_ref = np.trapz(y, t) / (t[-1] - t[0])
+
+    ap = arterial_pressure_metrics(y, t)
+    assert abs(ap["SBP"] - np.max(y)) < 1e-12
+    assert abs(ap["DBP"] - np.min(y)) < 1e-12
+    assert abs(ap["MAP"] - mean_ref) < 1e-9
+
+    fm = flow_metrics(y, t)
+    assert abs(fm["Q2_amp"] - 0.5 * (np.max(y) - np.min(y))) < 1e-12
+    assert abs(fm["Q2_mean"] - mean_ref) < 1e-9
+
+    sv = stroke_volume(y, t)
+    assert abs(sv["SV"] - np.ptp(y)) < 1e-12
+
+    assert abs(_trapz_mean(y, t) - mean_ref) < 1e-9
+    ys, ts = y[::3], t[::3]
+    assert abs(_trapz_mean(ys, ts) - np.trapz(ys, ts) / (ts[-1] - ts[0])) < 1e-9
+
+
+def test_segment_metrics_propagate_nan():
+    t = np.linspace(0.0, 0.8, 801)
+    y = 80.0 + 10.0 * np.sin(2 * np.pi * t / 0.8)
+    for i in (0, 400):
+        y_bad = y.copy()
+        y_bad[i] = np.nan
+        ap = arterial_pressure_metrics(y_bad, t)
+        assert all(np.isnan(v) for v in ap.values())
+        assert np.isnan(_trapz_mean(y_bad, t))
+
+
+def test_valve_open_duration_matches_mask_reference():
+    t = np.linspace(0.0, 0.8, 801)
+    flow = 400.0 * np.clip(np.sin(2 * np.pi * t / 0.8), 0.0, None) - 1.0
+
+    vt = valve_timing_metrics(flow, t, rel_threshold=0.01)
+
+    is_open = flow > 0.01 * np.max(flow)
+    ref = np.sum(np.diff(t)[is_open[:-1] & is_open[1:]])
+    assert abs(vt["open_duration"] - ref) < 1e-12
+    assert abs(vt["t_peak"] - t[np.argmax(flow)]) < 1e-15
+
+
+def test_compute_all_metrics_batch_matches_single_runs():
+    t = make_time_grid(0.8, 3, 200)
+    rng = np.random.default_rng(3)
+
+    runs = []
+    for m in range(4):
+        phase = rng.uniform(0.0, 1.0)
+        base = np.sin(2 * np.pi * t / 0.8 + phase)
+        runs.append({
+            "p1": 90.0 + 20.0 * base,
+            "pLV": 60.0 + 60.0 * base,
+            "Vlv": 100.0 + 30.0 * base,
+            "Q2": 80.0 + 10.0 * base,
+            "P0": 300.0 * np.clip(-base, 0.0, None) - 0.5,
+            "P1": 500.0 * np.clip(base, 0.0, None) * (m + 1) - 0.5,
+        })
+    runs.append({k: np.full_like(t, -1.0) for k in runs[0]})  # valves never open
+
+    batch = {k: np.stack([r[k] for r in runs]) for k in runs[0]}
+    out = compute_all_metrics_batch(batch, t, 0.8)
+
+    for m, r in enumerate(runs):
+        ref = compute_all_metrics(r, t, 0.8)
+        assert set(out) == set(ref)
+        for k, v in ref.items():
+            assert abs(out[k][m] - v) <= 1e-9 * max(1.0, abs(v)), k
+
+
+def test_float32_signal_storage_gives_same_metrics():
+    params = healthy_params()
+    res = {}
+    for dtype in (np.float64, np.float32):
+        config = SimulationConfig(n_cycles=2, points_per_cycle=200, signal_dtype=dtype)
+        r = run_simulation(params, config)
+        assert r.x.dtype == np.float64
+        assert all(v.dtype == dtype for v in r.signals.values())
+        res[dtype] = compute_all_metrics(r.signals, r.t, params.Tcc)
+
+    for k, v in res[np.float64].items():
+        assert abs(res[np.float32][k] - v) <= 1e-5 * max(1.0, abs(v)), k
+
+
+def test_dense_last_cycles_give_same_last_cycle_metrics():
+    params = healthy_params()
+    config = SimulationConfig(n_cycles=4, points_per_cycle=200)
+    full = run_simulation(params, config)
+    tail = run_simulation(params, replace(config, dense_last_n_cycles=2))
+
+    assert tail.t.size == 2 * config.points_per_cycle + 1
+    np.testing.assert_array_equal(tail.t, full.t[-tail.t.size:])
+
+    m_full = compute_all_metrics(full.signals, full.t, params.Tcc)
+    m_tail = compute_all_metrics(tail.signals, tail.t, params.Tcc)
+    for k, v in m_full.items():
+        assert abs(m_tail[k] - v) <= 1e-3 * max(1.0, abs(v)), k
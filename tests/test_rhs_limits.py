@@ -1,10 +1,17 @@
+from dataclasses import replace
+
 import numpy as np
+import pytest
 
-from cardio.models.systemic_nonlinear import rhs
-from cardio.params.dataclasses import SimulationConfig
+from cardio.models.systemic_nonlinear import JAC_SPARSITY, jac, rhs
+from cardio.params.dataclasses import SimulationConfig, make_time_grid
 from cardio.params.healthy import healthy_params
 from cardio.params.pathology import combined_stiffness_and_afterload
-from cardio.simulation.pipeline import run_simulation
+from cardio.physiology.compliance import clv, dclv_dt
+from cardio.physiology.valves import VALVE_GATES, aortic_flow, mitral_flow
+from cardio.simulation.initial_conditions import default_initial_state
+from cardio.simulation.integrate import integrate_system, integrate_system_batched
+from cardio.simulation.pipeline import run_simulation, run_simulations
 
 
 def test_rhs_shape_and_finite_on_reasonable_state():
@@ -58,3 +65,221 @@ def test_short_simulation_is_finite_pathology():
     assert np.all(np.isfinite(res.x))
     assert np.all(np.isfinite(res.signals["p1"]))
     assert np.all(np.isfinite(res.signals["Vlv"]))
+
+
+def test_rhs_matches_reference_physiology():
+    for gate in VALVE_GATES:
+        params = replace(healthy_params(), valve_gate=gate)
+        Tcc = params.Tcc
+
+        rng = np.random.default_rng(1)
+        for t in np.linspace(0.0, 2.0 * Tcc, 37):
+            x = np.array([rng.uniform(0.0, 120.0), rng.uniform(-50.0, 300.0), rng.uniform(60.0, 120.0)])
+            pLV, Q2, p1 = x
+
+            C_LV = clv(float(t), params)
+            dC_LV = dclv_dt(float(t), params)
+            P0 = mitral_flow(params.pLA, pLV, params.RMV, params.k_valve, gate=gate)
+            P1 = aortic_flow(pLV, p1, params.RAV, params.k_valve, gate=gate)
+            expected = np.array([
+                (-pLV * dC_LV + P0 - P1) / C_LV,
+                (p1 - params.pRA - (params.Rcap + params.Rart) * Q2) / params.Iart,
+                (P1 - Q2) / params.Cart,
+            ])
+
+            dx = rhs(t=float(t), x=x, params=params)
+            np.testing.assert_allclose(dx, expected, rtol=1e-9, atol=1e-9)
+
+
+def test_get_state_returns_contiguous_columns():
+    params = healthy_params()
+    config = SimulationConfig(n_cycles=1, points_per_cycle=100)
+    res = run_simulation(params=params, config=config)
+
+    for i, name in enumerate(res.state_names()):
+        s = res.get_state(name)
+        assert s.flags.c_contiguous
+        np.testing.assert_array_equal(s, res.x[:, i])
+
+
+def test_signals_share_one_buffer():
+    params = healthy_params()
+    config = SimulationConfig(n_cycles=1, points_per_cycle=100, signal_dtype=np.float64)
+    res = run_simulation(params=params, config=config)
+
+    sig = res.signals
+    assert sig.array.shape == (len(sig), res.t.size)
+    for name in sig:
+        assert sig[name].flags.c_contiguous
+        assert np.shares_memory(sig[name], sig.array)
+    np.testing.assert_array_equal(sig["p1"], res.x[:, 2])
+    assert "Vlv" in sig and "missing" not in sig
+    with pytest.raises(KeyError):
+        sig["missing"]
+
+
+def test_analytical_jacobian_matches_finite_differences():
+    params0 = healthy_params()
+    rng = np.random.default_rng(0)
+    mask = JAC_SPARSITY.toarray()
+
+    for gate in VALVE_GATES:
+        params = replace(params0, valve_gate=gate, k_valve=0.5)
+        for _ in range(20):
+            t = rng.uniform(0.0, 2 * params.Tcc)
+            x = np.array([rng.uniform(0, 120), rng.uniform(-50, 300), rng.uniform(60, 120)])
+
+            J = jac(t, x, params)
+            J_fd = np.empty((3, 3))
+            for j in range(3):
+                h = 1e-6 * max(1.0, abs(x[j]))
+                e = np.zeros(3)
+                e[j] = h
+                J_fd[:, j] = (rhs(t, x + e, params) - rhs(t, x - e, params)) / (2 * h)
+
+            np.testing.assert_allclose(J, J_fd, rtol=1e-5, atol=1e-6 * np.abs(J_fd).max())
+            assert np.all(J[~mask] == 0.0)
+
+
+def test_implicit_method_with_jacobian_matches_rk45():
+    params = healthy_params()
+    config = SimulationConfig(n_cycles=2, points_per_cycle=200, method="RK45")
+    res_rk = run_simulation(params=params, config=config)
+
+    for method in ("Radau", "LSODA"):
+        res = run_simulation(params=params, config=replace(config, method=method))
+        np.testing.assert_allclose(res.x, res_rk.x, rtol=1e-3, atol=1e-2)
+
+
+def test_numba_dopri5_matches_solve_ivp():
+    params = combined_stiffness_and_afterload(healthy_params())
+    config = SimulationConfig(n_cycles=2, points_per_cycle=200, rtol=1e-8, atol=1e-10)
+    res_ref = run_simulation(params=params, config=config)
+    res_nb = run_simulation(params=params, config=replace(config, method="numba_dopri5"))
+
+    np.testing.assert_array_equal(res_nb.t, res_ref.t)
+    np.testing.assert_allclose(res_nb.x, res_ref.x, rtol=1e-5, atol=1e-4)
+
+
+def test_integrate_system_returns_view_unless_copy_requested():
+    params = healthy_params()
+    config = SimulationConfig(n_cycles=1, points_per_cycle=100)
+    t_eval = make_time_grid(params.Tcc, config.n_cycles, config.points_per_cycle)
+    x0 = default_initial_state(params)
+
+    t, x = integrate_system(params, config, x0, t_eval)
+    t_c, x_c = integrate_system(params, config, x0, t_eval, copy=True)
+
+    assert x.shape == x_c.shape == (t_eval.size, 3)
+    assert x.base is not None and x_c.flags.owndata and x_c.flags.c_contiguous
+    np.testing.assert_array_equal(x, x_c)
+    np.testing.assert_array_equal(t, t_c)
+
+
+def test_integrate_system_rejects_non_increasing_grid():
+    params = healthy_params()
+    config = SimulationConfig()
+    x0 = default_initial_state(params)
+
+    for t_eval in ([0.0, 0.1, 0.1, 0.2], [0.0, 0.2, 0.1], [0.0, np.nan, 0.2]):
+        with pytest.raises(ValueError):
+            integrate_system(params, config, x0, np.array(t_eval))
+
+
+def test_batched_integration_matches_individual_runs():
+    base = healthy_params()
+    params_list = [
+        base,
+        combined_stiffness_and_afterload(base),
+        replace(base, valve_gate="algebraic", Cart=0.8 * base.Cart),
+    ]
+    x0_stack = np.stack([default_initial_state(p) for p in params_list])
+
+    for method, rtol in (("RK45", 1e-3), ("numba_dopri5", 1e-12)):
+        config = SimulationConfig(n_cycles=1, points_per_cycle=100, method=method)
+        t_eval = make_time_grid(base.Tcc, config.n_cycles, config.points_per_cycle)
+
+        t, X = integrate_system_batched(params_list, config, x0_stack, t_eval)
+        assert X.shape == (t_eval.size, 3, len(params_list))
+        np.testing.assert_array_equal(t, t_eval)
+        for k, (p, x0) in enumerate(zip(params_list, x0_stack)):
+            _, x = integrate_system(p, config, x0, t_eval)
+            np.testing.assert_allclose(X[:, :, k], x, rtol=rtol, atol=rtol)
+
+    with pytest.raises(ValueError):
+        integrate_system_batched(params_list, config, x0_stack[:2], t_eval)
+
+
+def test_run_simulations_matches_run_simulation():
+    base = healthy_params()
+    params_list = [base, combined_stiffness_and_afterload(base)]
+    x0 = default_initial_state(base)
+    config = SimulationConfig(
+        n_cycles=3, points_per_cycle=100, method="numba_dopri5", dense_last_n_cycles=1
+    )
+
+    results = run_simulations(params_list, config, x0=x0)
+    assert len(results) == len(params_list)
+    for p, res in zip(params_list, results):
+        ref = run_simulation(p, config, x0=x0)
+        assert res.params is p
+        np.testing.assert_array_equal(res.t, ref.t)
+        np.testing.assert_allclose(res.x, ref.x, rtol=1e-12, atol=1e-12)
+        np.testing.assert_allclose(res.signals["P1"], ref.signals["P1"], rtol=1e-6, atol=1e-6)
+        assert res.get_state("p1").flags.c_contiguous
+
+    with pytest.raises(ValueError):
+        run_simulations(params_list, config, x0=np.zeros((3, 3)))
+
+
+def test_scenario_pair_with_executor_matches_sequential():
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    from cardio.simulation.pipeline import run_scenario_pair
+
+    healthy = healthy_params()
+    path = combined_stiffness_and_afterload(healthy)
+    config = SimulationConfig(n_cycles=1, points_per_cycle=100)
+    x0 = default_initial_state(healthy)
+
+    ref = [run_simulation(p, config, x0=x0) for p in (healthy, path)]
+    with ProcessPoolExecutor(max_workers=2, mp_context=multiprocessing.get_context("spawn")) as ex:
+        res = run_scenario_pair(healthy, path, config, x0=x0, executor=ex)
+
+    # The spawned workers run their own compilation of the fastmath kernels
+    # (or load it from the on-disk cache), which can round differently; the
+    # adaptive steps amplify that to ~1e-12, far below the solver tolerance.
+    for r, r_ref in zip(res, ref):
+        assert r.params == r_ref.params
+        np.testing.assert_allclose(r.x, r_ref.x, rtol=1e-9, atol=1e-9)
+
+    for r, r_ref in zip(run_scenario_pair(healthy, path, config, x0=x0), ref):
+        np.testing.assert_array_equal(r.x, r_ref.x)
+
+
+def test_warm_start_is_cached_and_periodic(tmp_path, monkeypatch):
+    from cardio.simulation import warmstart
+
+    monkeypatch.setenv("CARDIO_CACHE_DIR", str(tmp_path))
+    params = healthy_params()
+
+    x0 = warmstart.get_warm_start(params)
+    files = list(tmp_path.glob("warmstart_*.npy"))
+    assert len(files) == 1
+    np.testing.assert_array_equal(np.load(files[0]), x0)
+
+    # label/meta do not change the cache key; a model parameter or the
+    # warm-up solver settings do
+    config = SimulationConfig()
+    key = warmstart._cache_key(params, config)
+    assert warmstart._cache_key(replace(params, label="other"), config) == key
+    assert warmstart._cache_key(replace(params, Cart=1.0), config) != key
+    assert warmstart._cache_key(params, replace(config, method="LSODA")) != key
+    assert warmstart._cache_key(params, replace(config, rtol=1e-8)) != key
+    np.testing.assert_array_equal(warmstart.get_warm_start(replace(params, label="other")), x0)
+
+    # already on the periodic orbit: one more cycle returns to the same state
+    config = SimulationConfig(rtol=1e-8, atol=1e-10)
+    _, x = integrate_system(params, config, x0, np.array([0.0, params.Tcc]))
+    np.testing.assert_allclose(x[-1], x0, rtol=1e-3, atol=1e-2)
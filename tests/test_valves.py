@@ -0,0 +1,95 @@
+from dataclasses import replace
+
+import numpy as np
+import pytest
+
+from cardio.models.signals import reconstruct_signals
+from cardio.params.healthy import healthy_params
+
+from cardio.physiology.valves import (
+    VALVE_GATES,
+    aortic_flow,
+    heaviside_algebraic,
+    heaviside_hard,
+    heaviside_rational,
+    heaviside_smooth,
+    mitral_flow,
+)
+
+
+def test_algebraic_gate_matches_tanh_at_origin():
+    k = 50.0
+    eps = 1e-7
+
+    assert heaviside_algebraic(0.0, k) == pytest.approx(0.5)
+    slope_tanh = (heaviside_smooth(eps, k) - heaviside_smooth(-eps, k)) / (2 * eps)
+    slope_alg = (heaviside_algebraic(eps, k) - heaviside_algebraic(-eps, k)) / (2 * eps)
+    assert slope_alg == pytest.approx(slope_tanh, rel=1e-6)
+
+    x = np.linspace(-5.0, 5.0, 1001)
+    H = heaviside_algebraic(x, k)
+    assert np.all((H >= 0.0) & (H <= 1.0))
+    assert np.all(np.diff(H) >= 0.0)
+
+
+def test_rational_and_hard_gates():
+    k = 50.0
+    eps = 1e-7
+
+    assert heaviside_rational(0.0, k) == pytest.approx(0.5)
+    slope = (heaviside_rational(eps, k) - heaviside_rational(-eps, k)) / (2 * eps)
+    assert slope == pytest.approx(k / 2, rel=1e-4)
+
+    x = np.linspace(-5.0, 5.0, 1001)
+    H = heaviside_rational(x, k)
+    assert np.all((H >= 0.0) & (H <= 1.0))
+    assert np.all(np.diff(H) >= 0.0)
+
+    np.testing.assert_array_equal(heaviside_hard(x, k), (x > 0).astype(float))
+
+    pLV = np.linspace(0.0, 20.0, 101)
+    np.testing.assert_allclose(mitral_flow(8.0, pLV, 0.01, k, gate="hard"), np.maximum(8.0 - pLV, 0.0) / 0.01)
+
+
+def test_valve_flows_nearly_gate_independent_away_from_zero():
+    pLV = np.linspace(20.0, 140.0, 200)
+    for gate in ("tanh", "algebraic"):
+        P1 = aortic_flow(pLV, 80.0, 0.1, 50.0, gate=gate)
+        np.testing.assert_allclose(P1, np.maximum(pLV - 80.0, 0.0) / 0.1, atol=1e-2)
+
+    with pytest.raises(ValueError):
+        mitral_flow(8.0, 5.0, 0.01, 50.0, gate="unknown")
+
+
+def test_scalar_fast_paths_match_array_paths():
+    k = 50.0
+    x = np.array([-3.0, -0.01, 0.0, 0.004, 2.5])
+    for f in (heaviside_smooth, heaviside_algebraic, heaviside_rational, heaviside_hard):
+        H = f(x, k)
+        for xi, Hi in zip(x, H):
+            h = f(float(xi), k)
+            assert isinstance(h, float)
+            assert h == pytest.approx(Hi, rel=1e-14, abs=1e-15)
+
+    pLV = np.array([0.0, 7.9, 8.0, 8.1, 120.0])
+    for gate in ("tanh", "algebraic", "rational", "hard"):
+        P0 = mitral_flow(8.0, pLV, 0.01, k, gate=gate)
+        P1 = aortic_flow(pLV, 80.0, 0.1, k, gate=gate)
+        for i, p in enumerate(pLV):
+            assert mitral_flow(8.0, float(p), 0.01, k, gate=gate) == pytest.approx(P0[i], rel=1e-13, abs=1e-12)
+            assert aortic_flow(float(p), 80.0, 0.1, k, gate=gate) == pytest.approx(P1[i], rel=1e-13, abs=1e-12)
+
+
+def test_reconstructed_valve_flows_match_reference():
+    t = np.linspace(0.0, 2.4, 1201)
+    pLV = 60.0 + 60.0 * np.sin(2 * np.pi * t / 0.8)
+    p1 = 80.0 + 10.0 * np.cos(2 * np.pi * t / 0.8)
+    x = np.column_stack([pLV, np.zeros_like(t), p1])
+
+    for gate in VALVE_GATES:
+        params = replace(healthy_params(), valve_gate=gate)
+        sig = reconstruct_signals(t, x, params)
+        P0 = mitral_flow(params.pLA, pLV, params.RMV, params.k_valve, gate=gate)
+        P1 = aortic_flow(pLV, p1, params.RAV, params.k_valve, gate=gate)
+        np.testing.assert_allclose(sig["P0"], P0, rtol=1e-12, atol=1e-9)
+        np.testing.assert_allclose(sig["P1"], P1, rtol=1e-12, atol=1e-9)